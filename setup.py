@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -14,16 +14,25 @@ setup(
     author_email='anton.dasyuk@gmail.com',
     maintainer="Ali-Abdulla Al-Sayed",
     maintainer_email="alexukr1999@gmail.com",
-    packages=find_packages('src'),
+    packages=['etsy3py'],
     package_dir={'': 'src'},
     url='https://github.com/damhuman/Etsy3Py',
     keywords=['etsy', 'api', 'client', 'etsy v3 api'],
     install_requires=[
         'requests',
+        'urllib3>=1.26',
         'requests-oauthlib',
+        'cachetools',
+        'brotli; platform_python_implementation == "CPython"',
+        'brotlicffi; platform_python_implementation == "PyPy"',
         'mypy',
     ],
-    python_requires='>=3.6',
+    extras_require={
+        'async': ['aiohttp', 'aiolimiter'],
+        'speedups': ['orjson'],
+        'http2': ['httpx[http2]'],
+    },
+    python_requires='>=3.7',
     classifiers=[
         "Programming Language :: Python :: 3",
         'Development Status :: 4 - Beta',
@@ -0,0 +1,212 @@
+import asyncio
+import gzip
+from collections import OrderedDict
+from typing import Dict, Optional, TypeVar
+
+import aiohttp
+from aiolimiter import AsyncLimiter
+
+from etsy3py.params import prepare_params
+from etsy3py.rate_limit import backoff_delay, daily_quota_exhausted
+from etsy3py.serialization import dumps, orjson
+
+_ClientT = TypeVar('_ClientT', bound='AsyncBaseApiClient')
+
+
+class AsyncBaseApiClient:
+    __slots__ = ('__token_type', '__token', '__client_id', '_auth_header', '_basic_auth', '_base_url', '_session',
+                 '_semaphore', '_limiter', '_inflight', '_etag_cache')
+
+    base_url = "https://openapi.etsy.com"
+    etag_cache_size = 2048
+    max_concurrency = 15
+    # Every endpoint lives on a single host, the per-host limit is what bounds the pool
+    connection_limit = 100
+    connection_limit_per_host = 64
+    keepalive_timeout = 75
+    dns_cache_ttl = 300
+    rate_limit_per_second = 10
+    rate_limit_retries = 5
+    rate_limit_max_backoff = 60
+    # Gzip JSON request bodies of at least this many bytes, e.g. large inventory updates. Off by default, as the API
+    # does not document support for compressed requests.
+    gzip_request_threshold: Optional[int] = None
+
+    def __init__(self, token: Optional[str] = None, client_id: Optional[str] = None,
+                 token_type: Optional[str] = None, client_secret: Optional[str] = None) -> None:
+        self.__token_type = token_type
+        self.__token = token
+        self.__client_id = client_id
+        self._auth_header = {'Authorization': f'{token_type} {token}'}
+        self._basic_auth = aiohttp.BasicAuth(client_id, client_secret) if client_id and client_secret else None
+        self._base_url = self.base_url
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._limiter: Optional[AsyncLimiter] = None
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        # Coroutines share one thread, so unlike the sync client the store needs no lock
+        self._etag_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+
+    # The session and semaphore are created lazily so that they bind to the running event loop
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit,
+                                             limit_per_host=self.connection_limit_per_host,
+                                             keepalive_timeout=self.keepalive_timeout,
+                                             ttl_dns_cache=self.dns_cache_ttl)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  headers={'x-api-key': f'{self.__client_id}'})
+        return self._session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _get_limiter(self) -> AsyncLimiter:
+        if self._limiter is None:
+            self._limiter = AsyncLimiter(self.rate_limit_per_second, 1)
+        return self._limiter
+
+    async def _make_request(self,
+                            path: str,
+                            custom_base: Optional[str] = None,
+                            method: str = 'GET',
+                            headers: Optional[dict] = None,
+                            data: Optional[dict] = None,
+                            params: Optional[dict] = None,
+                            auth_type: str = 'token') -> aiohttp.ClientResponse:
+
+        request_url = (custom_base or self._base_url) + path
+
+        auth = None
+        if auth_type == 'basic':
+            if self._basic_auth is None:
+                raise ValueError("client_secret is required for requests with basic authentication")
+            auth = self._basic_auth
+        if auth_type == 'token':
+            headers = {**self._auth_header, **(headers or {})}
+
+        body = dumps(data) if isinstance(data, dict) else data
+        if isinstance(data, dict):
+            headers = {**(headers or {}), 'Content-Type': 'application/json'}
+        if (self.gzip_request_threshold is not None and isinstance(body, bytes)
+                and len(body) >= self.gzip_request_threshold):
+            body = gzip.compress(body, compresslevel=6)
+            headers = {**(headers or {}), 'Content-Encoding': 'gzip'}
+
+        session = self._get_session()
+        attempt = 0
+        while True:
+            async with self._get_semaphore(), self._get_limiter():
+                response = await session.request(method,
+                                                 request_url,
+                                                 headers=headers,
+                                                 # aiohttp refuses bool and None query values
+                                                 params=prepare_params(params),
+                                                 data=body,
+                                                 auth=auth)
+                # Read the body while holding the slot so the connection goes back to the pool
+                await response.read()
+            if (response.status != 429 or attempt >= self.rate_limit_retries
+                    or daily_quota_exhausted(response.headers)):
+                return response
+            # Wait outside of the slot, other requests may proceed meanwhile
+            await asyncio.sleep(backoff_delay(response.headers, attempt, self.rate_limit_max_backoff))
+            attempt += 1
+
+    @staticmethod
+    async def _json(response: aiohttp.ClientResponse):
+        # _make_request has already read the body, orjson parses the bytes without aiohttp's text decoding
+        if orjson is None:
+            return await response.json()
+        return orjson.loads(await response.read())
+
+    async def _post(self, path: str, data: Optional[dict] = None, headers: Optional[dict] = None,
+                    auth_type: str = 'none') -> aiohttp.ClientResponse:
+        return await self._make_request(path=path, method='POST', data=data,
+                                        headers=headers, auth_type=auth_type)
+
+    async def _get(self, path: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+                   auth_type: str = 'none') -> aiohttp.ClientResponse:
+        # Identical GETs issued while one is in flight await its response instead of sending their own
+        params = prepare_params(params)
+        etag_key = (path,
+                    tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()))
+                    if params else ())
+        key = (etag_key, tuple(sorted(headers.items())) if headers else (), auth_type)
+        try:
+            hash(key)
+        except TypeError:
+            return await self._make_request(path=path, method='GET', params=params,
+                                            headers=headers, auth_type=auth_type)
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._conditional_get(etag_key, path, params, headers, auth_type))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._inflight.pop(key, None)
+                                     if self._inflight.get(key) is done else None)
+        # A cancelled caller must not cancel the request the other callers are waiting for
+        return await asyncio.shield(future)
+
+    async def _conditional_get(self, etag_key: tuple, path: str, params: Optional[dict] = None,
+                               headers: Optional[dict] = None, auth_type: str = 'none') -> aiohttp.ClientResponse:
+        # Revalidate with the ETag / Last-Modified of the previous response, a 304 returns the stored one
+        cached = self._etag_cache.get(etag_key)
+        if cached is not None:
+            headers = {**(headers or {}), **cached[0]}
+
+        response = await self._make_request(path=path, method='GET', params=params,
+                                            headers=headers, auth_type=auth_type)
+
+        if response.status == 304 and cached is not None:
+            if etag_key in self._etag_cache:
+                self._etag_cache.move_to_end(etag_key)
+            return cached[1]
+        if response.status == 200:
+            validators = {}
+            if 'ETag' in response.headers:
+                validators['If-None-Match'] = response.headers['ETag']
+            if 'Last-Modified' in response.headers:
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            if validators:
+                self._etag_cache[etag_key] = (validators, response)
+                self._etag_cache.move_to_end(etag_key)
+                if len(self._etag_cache) > self.etag_cache_size:
+                    self._etag_cache.popitem(last=False)
+        return response
+
+    async def _patch(self, path: str, data: Optional[dict] = None, headers: Optional[dict] = None,
+                     auth_type: str = 'none') -> aiohttp.ClientResponse:
+        return await self._make_request(path=path, method='PATCH', data=data,
+                                        headers=headers, auth_type=auth_type)
+
+    async def _put(self, path: str, data: Optional[dict] = None, headers: Optional[dict] = None,
+                   auth_type: str = 'none') -> aiohttp.ClientResponse:
+        return await self._make_request(path=path, method='PUT', data=data,
+                                        headers=headers, auth_type=auth_type)
+
+    async def _delete(self, path: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+                      auth_type: str = 'none') -> aiohttp.ClientResponse:
+        return await self._make_request(path=path, method='DELETE', params=params,
+                                        headers=headers, auth_type=auth_type)
+
+    async def __aenter__(self: _ClientT) -> _ClientT:
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying aiohttp session and releases its connections.
+        The client can be used again afterwards, also from another event loop.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        # Both are bound to the loop they were first used in
+        self._semaphore = None
+        self._limiter = None
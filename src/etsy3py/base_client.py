@@ -1,68 +1,442 @@
+import gzip
+import io
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Optional, Tuple, TypeVar, Union
+
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-from requests import Request, Session
+from requests import Session
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util import connection, make_headers
+from urllib3.util.retry import Retry
+
+from etsy3py.params import prepare_params
+from etsy3py.rate_limit import TokenBucket, backoff_delay, daily_quota_exhausted
+from etsy3py.serialization import StreamedJSONBody, dumps, orjson
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+# Only the encodings urllib3 can decode here, br needs brotli and zstd needs zstandard to be installed
+_ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+
+class ApiResponse(requests.Response):
+    """
+    requests.Response whose json() decodes the body with orjson when it is installed.
+    """
+    def json(self, **kwargs):
+        if orjson is None or kwargs:
+            return super().json(**kwargs)
+        try:
+            return orjson.loads(self.content)
+        except orjson.JSONDecodeError:
+            # Defer to requests for non UTF-8 bodies and for its own JSONDecodeError
+            return super().json()
+
+
+class ApiHTTPAdapter(HTTPAdapter):
+    def build_response(self, req, resp) -> requests.Response:
+        response = super().build_response(req, resp)
+        response.__class__ = ApiResponse
+        return response
+
+
+class _PinnedResolver:
+    """
+    Thread-safe cache of one resolved address per host, resolved again once it is older than `ttl` seconds.
+    """
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._addresses: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> str:
+        with self._lock:
+            entry = self._addresses.get(host)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        address = str(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][4][0])
+        with self._lock:
+            self._addresses[host] = (address, time.monotonic() + self.ttl)
+        return address
+
+    def invalidate(self, host: str) -> None:
+        with self._lock:
+            self._addresses.pop(host, None)
+
+
+class _PinnedHTTPSConnection(HTTPSConnection):
+    resolver: _PinnedResolver
+
+    def _new_conn(self) -> socket.socket:
+        # Only the TCP connection goes to the pinned address, SNI and certificate checks keep using self.host
+        try:
+            address = self.resolver.resolve(self._dns_host, self.port)
+            return connection.create_connection((address, self.port),
+                                                self.timeout,
+                                                source_address=self.source_address,
+                                                socket_options=self.socket_options)
+        except socket.timeout as e:
+            self.resolver.invalidate(self._dns_host)
+            raise ConnectTimeoutError(self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})") from e
+        except OSError as e:
+            # The address may have been retired, resolve again on the next attempt
+            self.resolver.invalidate(self._dns_host)
+            raise NewConnectionError(self, f"Failed to establish a new connection: {e}") from e
+
+
+class PinnedDNSAdapter(ApiHTTPAdapter):
+    """
+    ApiHTTPAdapter that connects to a cached address of the API host, which takes the resolver off the request path.
+    The address is resolved again lazily once it is older than `dns_ttl` seconds, or after a failed connection attempt.
+    """
+    def __init__(self, dns_ttl: float = 60, **kwargs) -> None:
+        self._resolver = _PinnedResolver(dns_ttl)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        connection_cls = type('PinnedHTTPSConnection', (_PinnedHTTPSConnection,), {'resolver': self._resolver})
+        pool_cls = type('PinnedHTTPSConnectionPool', (HTTPSConnectionPool,), {'ConnectionCls': connection_cls})
+        self.poolmanager.pool_classes_by_scheme = {**self.poolmanager.pool_classes_by_scheme, 'https': pool_cls}
+
+
+class ApiRetry(Retry):
+    """
+    urllib3 Retry that only honours Retry-After on 503.
+
+    429 is retried by BaseApiClient._make_request, which paces the attempts through the rate limiter, caps their wait
+    and gives up on an exhausted daily quota. Replaying a 413 is pointless, the body stays too large.
+    Custom max_retries should derive from this class, a plain Retry would retry 429 and 413 a second time.
+    """
+    RETRY_AFTER_STATUS_CODES = frozenset([503])
+
+
+_ClientT = TypeVar('_ClientT', bound='BaseApiClient')
+
+
+class HTTPXSession:
+    """
+    Stand-in for requests.Session that sends requests through an HTTP/2 httpx.Client, so concurrent requests
+    from several threads are multiplexed over a single connection to openapi.etsy.com.
+
+    Responses and errors are converted to their requests counterparts, the clients' public API is unchanged.
+    """
+    def __init__(self, max_keepalive_connections: int = 16, max_connections: int = 64, retries: int = 3) -> None:
+        if httpx is None:
+            raise ImportError("http2=True requires httpx, install it with `pip install etsy3py[http2]`")
+        self.headers: CaseInsensitiveDict = CaseInsensitiveDict()
+        self._limits = httpx.Limits(max_keepalive_connections=max_keepalive_connections,
+                                    max_connections=max_connections)
+        self._retries = retries
+        self._lock = threading.Lock()
+        self._client = self._new_client()
+
+    def _new_client(self) -> 'httpx.Client':
+        # The transport only retries failed connection attempts, unlike urllib3's Retry it never replays a request
+        transport = httpx.HTTPTransport(http2=True, retries=self._retries, limits=self._limits)
+        return httpx.Client(transport=transport)
+
+    def _get_client(self) -> 'httpx.Client':
+        # A closed httpx.Client cannot be reopened, recreate it so that close() behaves like requests.Session.close()
+        if self._client.is_closed:
+            with self._lock:
+                if self._client.is_closed:
+                    self._client = self._new_client()
+        return self._client
+
+    def request(self, method: str, url: str, headers: Optional[dict] = None, params: Optional[dict] = None,
+                data=None, auth=None, timeout=None, stream: bool = False) -> requests.Response:
+        if isinstance(auth, HTTPBasicAuth):
+            auth = (auth.username, auth.password)
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        if params:
+            # requests drops None values, httpx would send them as empty strings
+            params = {key: value for key, value in params.items() if value is not None}
+        try:
+            response = self._get_client().request(method,
+                                                  url,
+                                                  headers={**self.headers, **(headers or {})},
+                                                  params=params,
+                                                  content=data,
+                                                  auth=auth,
+                                                  timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(e) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e) from e
+        api_response = self._build_response(response)
+        if stream:
+            # The body is already buffered, expose it like urllib3 would for incremental parsers
+            api_response.raw = io.BytesIO(api_response.content)
+        return api_response
+
+    @staticmethod
+    def _build_response(resp) -> requests.Response:
+        response = ApiResponse()
+        response.status_code = resp.status_code
+        response.headers = CaseInsensitiveDict(resp.headers.items())
+        response.url = str(resp.url)
+        response.reason = resp.reason_phrase
+        response.encoding = resp.encoding
+        response._content = resp.content
+        return response
+
+    def close(self) -> None:
+        self._client.close()
 
 
 class BaseApiClient:
+    # __weakref__ lets cached() key its per-instance caches on the client
+    __slots__ = ('__token_type', '__token', '__client_id', '_auth_header', '_basic_auth', '_base_url', '_timeout',
+                 '_etag_cache', '_etag_lock', '_limiter', 'session', '_inflight', '_inflight_lock', '__weakref__')
+
     base_url = "https://openapi.etsy.com"
+    etag_cache_size = 2048
+    # Every endpoint lives on a single host, so one host pool with plenty of keep-alive connections is enough
+    pool_connections = 1
+    pool_maxsize = 64
+    # POST is left out on purpose: replaying it could e.g. create a listing or a shipment twice.
+    # 429 is handled by _make_request for every method, as a throttled request was never processed, see ApiRetry.
+    max_retries = ApiRetry(total=5,
+                           backoff_factor=0.5,
+                           status_forcelist=(500, 502, 503, 504),
+                           # Honoured for 503 only, 429 including its daily quota check is left to _make_request
+                           respect_retry_after_header=True,
+                           allowed_methods=frozenset(['GET', 'PUT', 'DELETE', 'PATCH']),
+                           # Hand back the last response once the retries are used up, like the http2 backend does
+                           raise_on_status=False)
+    # Etsy's default per-app quota, refined from the X-Limit-Per-Second response header
+    rate_limit_per_second = 10
+    rate_limit_retries = 5
+    rate_limit_max_backoff = 60
+    # Seconds a resolved address of the API host is reused, see PinnedDNSAdapter. None resolves on every connection.
+    dns_pin_ttl: Optional[float] = None
+    # Gzip JSON request bodies of at least this many bytes, e.g. large inventory updates. Off by default, as the API
+    # does not document support for compressed requests.
+    gzip_request_threshold: Optional[int] = None
 
-    def __init__(self, token: str = None, client_id: str = None, token_type: str = None) -> None:
+    def __init__(self, token: Optional[str] = None, client_id: Optional[str] = None,
+                 token_type: Optional[str] = None, timeout: tuple = (5, 30),
+                 client_secret: Optional[str] = None, http2: bool = False) -> None:
         self.__token_type = token_type
         self.__token = token
         self.__client_id = client_id
-        self.session = Session()
+        self._auth_header = {'Authorization': f'{token_type} {token}'}
+        self._basic_auth = HTTPBasicAuth(client_id, client_secret) if client_id and client_secret else None
+        self._base_url = self.base_url
+        self._timeout = timeout
+        self._etag_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self._inflight: 'dict[tuple, Future]' = {}
+        self._inflight_lock = threading.Lock()
+        self._limiter = TokenBucket(rate=self.rate_limit_per_second, capacity=self.rate_limit_per_second)
+        self.session: Union[Session, HTTPXSession]
+        if http2:
+            # httpx advertises the encodings it can decode itself, which may differ from urllib3's
+            self.session = HTTPXSession(max_connections=self.pool_maxsize)
+        else:
+            self.session = Session()
+            adapter: ApiHTTPAdapter
+            if self.dns_pin_ttl is None:
+                adapter = ApiHTTPAdapter(pool_connections=self.pool_connections,
+                                         pool_maxsize=self.pool_maxsize,
+                                         max_retries=self.max_retries)
+            else:
+                adapter = PinnedDNSAdapter(dns_ttl=self.dns_pin_ttl,
+                                           pool_connections=self.pool_connections,
+                                           pool_maxsize=self.pool_maxsize,
+                                           max_retries=self.max_retries)
+            # http:// as well, so a base_url override such as a local mock server gets the same retry policy
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            self.session.headers['Accept-Encoding'] = _ACCEPT_ENCODING
+        self.session.headers['x-api-key'] = f'{client_id}'
+
+    def __enter__(self: _ClientT) -> _ClientT:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying session and releases its pooled connections.
+        """
+        self.session.close()
 
     def _make_request(self,
                       path: str,
-                      custom_base: str = None,
+                      custom_base: Optional[str] = None,
                       method: str = 'GET',
-                      headers: dict = None,
-                      data: dict = None,
-                      params: dict = None,
-                      auth_type: str = 'token') -> requests.Response:
-
-        if not headers:
-            headers = {}
+                      headers: Optional[dict] = None,
+                      data: Union[dict, StreamedJSONBody, None] = None,
+                      params: Optional[dict] = None,
+                      auth_type: str = 'token',
+                      stream: bool = False) -> requests.Response:
 
-        request_url = f"{custom_base if custom_base else self.base_url}{path}"
+        request_url = (custom_base or self._base_url) + path
 
         auth = None
         if auth_type == 'basic':
-            auth = HTTPBasicAuth(1, 1)
+            if self._basic_auth is None:
+                raise ValueError("client_secret is required for requests with basic authentication")
+            auth = self._basic_auth
         if auth_type == 'token':
-            headers['Authorization'] = f'{self.__token_type} {self.__token}'
-            headers['x-api-key'] = f'{self.__client_id}'
-
-        request = Request(method=method,
-                          url=request_url,
-                          headers=headers,
-                          data=data,
-                          params=params,
-                          auth=auth).prepare()
-        response = self.session.send(request)
-        return response
+            headers = {**self._auth_header, **(headers or {})}
+
+        # Etsy expects JSON bodies, and nested payloads such as inventory products cannot be form-encoded
+        body = dumps(data) if isinstance(data, dict) else data
+        if isinstance(data, (dict, StreamedJSONBody)):
+            headers = {**(headers or {}), 'Content-Type': 'application/json'}
+        if (self.gzip_request_threshold is not None and isinstance(body, bytes)
+                and len(body) >= self.gzip_request_threshold):
+            body = gzip.compress(body, compresslevel=6)
+            headers = {**(headers or {}), 'Content-Encoding': 'gzip'}
+
+        attempt = 0
+        while True:
+            self._limiter.acquire()
+            response = self.session.request(method,
+                                            request_url,
+                                            headers=headers,
+                                            params=params,
+                                            data=body,
+                                            auth=auth,
+                                            timeout=self._timeout,
+                                            stream=stream)
+            self._update_rate_limit(response)
+            if (response.status_code != 429 or attempt >= self.rate_limit_retries
+                    or daily_quota_exhausted(response.headers)):
+                return response
+            if stream:
+                # Hand the unread connection back to the pool before retrying
+                response.close()
+            time.sleep(backoff_delay(response.headers, attempt, self.rate_limit_max_backoff))
+            attempt += 1
 
-    def _post(self, path: str, data: dict = None, headers: dict = None,
+    def _update_rate_limit(self, response: requests.Response) -> None:
+        try:
+            limit = response.headers.get('X-Limit-Per-Second')
+            remaining = response.headers.get('X-Remaining-This-Second')
+            self._limiter.update(remaining=float(remaining) if remaining is not None else None,
+                                 rate=float(limit) if limit is not None else None)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def _etag_key(path: str, params: Optional[dict] = None) -> tuple:
+        if not params:
+            return path, ()
+        return path, tuple(sorted((key, tuple(value) if isinstance(value, list) else value)
+                                  for key, value in params.items()))
+
+    def _store_etag(self, key: tuple, validators: dict, response: requests.Response) -> None:
+        with self._etag_lock:
+            self._etag_cache[key] = (validators, response)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > self.etag_cache_size:
+                self._etag_cache.popitem(last=False)
+
+    def _post(self, path: str, data: Optional[dict] = None, headers: Optional[dict] = None,
               auth_type: str = 'none') -> requests.Response:
         return self._make_request(path=path, method='POST', data=data,
                                   headers=headers, auth_type=auth_type)
 
-    def _get(self, path: str, params: dict = None, headers: dict = None,
+    def _get(self, path: str, params: Optional[dict] = None, headers: Optional[dict] = None,
              auth_type: str = 'none') -> requests.Response:
-        return self._make_request(path=path, method='GET', params=params,
-                                  headers=headers, auth_type=auth_type)
+        # Normalized first, so that omitting a parameter and passing None share cache and in-flight entries
+        params = prepare_params(params)
+        # Identical GETs issued while one is in flight wait for its response instead of sending their own
+        key = (self._etag_key(path, params), tuple(sorted(headers.items())) if headers else (), auth_type)
+        try:
+            hash(key)
+        except TypeError:
+            # Neither the in-flight map nor the ETag store can key such params, e.g. a set
+            return self._make_request(path=path, method='GET', params=params,
+                                      headers=headers, auth_type=auth_type)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                leader = False
+            else:
+                leader = True
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            response = self._conditional_get(path, params, headers, auth_type)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return response
+
+    def _conditional_get(self, path: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+                         auth_type: str = 'none') -> requests.Response:
+        # Revalidate with the ETag / Last-Modified of the previous response, a 304 returns the stored one
+        etag_key = self._etag_key(path, params)
+        with self._etag_lock:
+            cached = self._etag_cache.get(etag_key)
+        if cached is not None:
+            headers = {**(headers or {}), **cached[0]}
+
+        response = self._make_request(path=path, method='GET', params=params,
+                                      headers=headers, auth_type=auth_type)
+
+        if response.status_code == 304 and cached is not None:
+            with self._etag_lock:
+                if etag_key in self._etag_cache:
+                    self._etag_cache.move_to_end(etag_key)
+            return cached[1]
+        if response.status_code == 200:
+            validators = {}
+            if 'ETag' in response.headers:
+                validators['If-None-Match'] = response.headers['ETag']
+            if 'Last-Modified' in response.headers:
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            if validators:
+                self._store_etag(etag_key, validators, response)
+        return response
+
+    def _get_stream(self, path: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+                    auth_type: str = 'none') -> requests.Response:
+        # Bypasses the ETag store and in-flight sharing, a streamed body can only be consumed once
+        response = self._make_request(path=path, method='GET', params=prepare_params(params),
+                                      headers=headers, auth_type=auth_type, stream=True)
+        if response.raw is not None and hasattr(response.raw, 'decode_content'):
+            response.raw.decode_content = True
+        return response
 
-    def _patch(self, path: str, data: dict = None, headers: dict = None,
+    def _patch(self, path: str, data: Optional[dict] = None, headers: Optional[dict] = None,
                auth_type: str = 'none') -> requests.Response:
         return self._make_request(path=path, method='PATCH', data=data,
                                   headers=headers, auth_type=auth_type)
 
-    def _put(self, path: str, data: dict = None, headers: dict = None,
+    def _put(self, path: str, data: Union[dict, StreamedJSONBody, None] = None, headers: Optional[dict] = None,
              auth_type: str = 'none') -> requests.Response:
         return self._make_request(path=path, method='PUT', data=data,
                                   headers=headers, auth_type=auth_type)
 
-    def _delete(self, path: str, params: dict = None, headers: dict = None,
+    def _delete(self, path: str, params: Optional[dict] = None, headers: Optional[dict] = None,
                 auth_type: str = 'none') -> requests.Response:
-        return self._make_request(path=path, method='DELETE', params=params,
+        return self._make_request(path=path, method='DELETE', params=prepare_params(params),
                                   headers=headers, auth_type=auth_type)
@@ -0,0 +1,116 @@
+import functools
+import inspect
+import threading
+import weakref
+
+from cachetools import LRUCache, TTLCache
+
+
+def _freeze(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def cached(ttl: int = 60, maxsize: int = 1024, stale_if_error: bool = False):
+    """
+    Caches successful responses of an API client method for `ttl` seconds.
+
+    Entries are kept per client instance, so clients authorized with different tokens never share results.
+    The wrapped method gains two helpers:
+    `cache_clear_for(instance, *args, **kwargs)` drops the entry of one call and
+    `cache_clear(instance)` drops every entry of an instance.
+
+    :param ttl: int - default: 60, the number of seconds a response is served from the cache
+    :param maxsize: int - default: 1024, the maximum number of cached responses per instance
+    :param stale_if_error: bool - default: False, when the request fails with a 5xx status or a connection error,
+                           return the last successful response of the call even if its ttl has expired
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        caches = weakref.WeakKeyDictionary()
+        # Last successful response per call, outliving the ttl, only kept with stale_if_error
+        fallbacks = weakref.WeakKeyDictionary()
+        lock = threading.Lock()
+
+        def make_key(instance, args, kwargs):
+            arguments = signature.bind(instance, *args, **kwargs).arguments
+            # The first bound argument is the instance itself, the cache is already scoped to it.
+            # None keyword arguments are never sent, so they must not split the cache either.
+            # Lists are keyed as tuples, like in BaseApiClient._etag_key. prepare_params sends both as the same comma
+            # separated value, so both hit the same entry.
+            key = tuple((name, frozenset((k, _freeze(v)) for k, v in value.items() if v is not None)
+                         if isinstance(value, dict) else _freeze(value))
+                        for name, value in list(arguments.items())[1:])
+            hash(key)
+            return key
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                key = make_key(self, args, kwargs)
+            except TypeError:
+                # Arguments that cannot be hashed, e.g. nested dicts, bypass the cache
+                return func(self, *args, **kwargs)
+
+            with lock:
+                cache = caches.get(self)
+                if cache is not None:
+                    # A single lookup, the entry may expire between a membership test and the read
+                    try:
+                        return cache[key]
+                    except KeyError:
+                        pass
+
+            # Responses are not streamed, so the body is already read and the connection is back in the pool
+            try:
+                response = func(self, *args, **kwargs)
+            except OSError:
+                # requests' ConnectionError and Timeout derive from OSError
+                fallback = get_fallback(self, key)
+                if fallback is None:
+                    raise
+                return fallback
+            if response.ok:
+                with lock:
+                    cache = caches.get(self)
+                    if cache is None:
+                        cache = caches[self] = TTLCache(maxsize=maxsize, ttl=ttl)
+                    cache[key] = response
+                    if stale_if_error:
+                        fallback_cache = fallbacks.get(self)
+                        if fallback_cache is None:
+                            fallback_cache = fallbacks[self] = LRUCache(maxsize=maxsize)
+                        fallback_cache[key] = response
+            elif response.status_code >= 500:
+                fallback = get_fallback(self, key)
+                if fallback is not None:
+                    return fallback
+            return response
+
+        def get_fallback(instance, key):
+            if not stale_if_error:
+                return None
+            with lock:
+                fallback_cache = fallbacks.get(instance)
+                return fallback_cache.get(key) if fallback_cache is not None else None
+
+        def cache_clear_for(instance, *args, **kwargs) -> None:
+            try:
+                key = make_key(instance, args, kwargs)
+            except TypeError:
+                # Such calls are never cached
+                return
+            with lock:
+                for store in (caches, fallbacks):
+                    cache = store.get(instance)
+                    if cache is not None:
+                        cache.pop(key, None)
+
+        def cache_clear(instance) -> None:
+            with lock:
+                caches.pop(instance, None)
+                fallbacks.pop(instance, None)
+
+        wrapper.cache_clear_for = cache_clear_for
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
@@ -0,0 +1,91 @@
+# Shared by EtsyApi and AsyncEtsyApi. Kept free of HTTP library imports, so neither client pulls in the other's.
+
+ME_PATH = "/v3/application/users/me"
+ACTIVE_LISTINGS_PATH = "/v3/application/listings/active"
+LISTINGS_BATCH_PATH = "/v3/application/listings/batch"
+SHOP_RECEIPT_PATH = "/v3/application/shops/{}/receipts/{}".format
+SHOP_RECEIPTS_PATH = "/v3/application/shops/{}/receipts".format
+RECEIPT_TRACKING_PATH = "/v3/application/shops/{}/receipts/{}/tracking".format
+LISTING_TRANSACTIONS_PATH = "/v3/application/shops/{}/listings/{}/transactions".format
+RECEIPT_TRANSACTIONS_PATH = "/v3/application/shops/{}/receipts/{}/transactions".format
+SHOP_TRANSACTION_PATH = "/v3/application/shops/{}/transactions/{}".format
+SHOP_TRANSACTIONS_PATH = "/v3/application/shops/{}/transactions".format
+LISTING_INVENTORY_PATH = "/v3/application/listings/{}/inventory".format
+SHOP_LISTINGS_PATH = "/v3/application/shops/{}/listings".format
+LISTING_PATH = "/v3/application/listings/{}".format
+SHOP_ACTIVE_LISTINGS_PATH = "/v3/application/shops/{}/listings/active".format
+SHOP_FEATURED_LISTINGS_PATH = "/v3/application/shops/{}/listings/featured".format
+SHOP_LISTING_PROPERTY_PATH = "/v3/application/shops/{}/listings/{}/properties/{}".format
+LISTING_PROPERTY_PATH = "/v3/application/listings/{}/properties/{}".format
+SHOP_LISTING_PROPERTIES_PATH = "/v3/application/shops/{}/listings/{}/properties".format
+SHOP_LISTING_PATH = "/v3/application/shops/{}/listings/{}".format
+RECEIPT_LISTINGS_PATH = "/v3/application/shops/{}/receipts/{}/listings".format
+RETURN_POLICY_LISTINGS_PATH = "/v3/application/shops/{}/policies/return/{}/listings".format
+SHOP_SECTION_LISTINGS_PATH = "/v3/application/shops/{}/shop-sections/listings".format
+LISTING_OFFERING_PATH = "/v3/application/listings/{}/products/{}/offerings/{}".format
+LISTING_PRODUCT_PATH = "/v3/application/listings/{}/inventory/products/{}".format
+
+# getListingsByListingIds accepts at most this many IDs per call
+LISTING_IDS_BATCH_SIZE = 100
+
+# Documented constraints of query parameters: name -> (type, allowed values or None)
+PAGINATION_SPEC = {
+    "limit": (int, range(1, 101)),
+    "offset": (int, None),
+}
+SHOP_RECEIPTS_SPEC = {
+    **PAGINATION_SPEC,
+    "min_created": (int, None),
+    "max_created": (int, None),
+    "min_last_modified": (int, None),
+    "max_last_modified": (int, None),
+    "sort_on": (str, {"created", "updated", "receipt_id"}),
+    "sort_order": (str, {"asc", "ascending", "desc", "descending", "up", "down"}),
+    "was_paid": (bool, None),
+    "was_shipped": (bool, None),
+    "was_delivered": (bool, None),
+}
+SHOP_LISTINGS_SPEC = {
+    **PAGINATION_SPEC,
+    "state": (str, {"active", "inactive", "sold_out", "draft", "expired"}),
+}
+LISTING_INVENTORY_SPEC = {
+    "includes": (str, {"Listing"}),
+    "show_deleted": (bool, None),
+}
+
+# The query string literals of booleans, see params.prepare_params
+_BOOL_LITERALS = {'true': True, 'false': False}
+
+
+def _coerce(value, expected_type):
+    # Only for the checks, the value itself is sent as given
+    if isinstance(value, str):
+        if expected_type is int:
+            try:
+                return int(value)
+            except ValueError:
+                return value
+        if expected_type is bool and value in _BOOL_LITERALS:
+            return _BOOL_LITERALS[value]
+    return value
+
+
+def validate_kwargs(spec: dict, kwargs: dict) -> None:
+    """
+    Checks the query parameters against their documented constraints, so requests Etsy would reject with a 400
+    fail locally instead of spending a round trip and a rate limit token. Unknown parameters are passed through,
+    as are the string forms Etsy accepts as well, e.g. limit='50' or was_paid='true'.
+    """
+    for key, value in kwargs.items():
+        if key not in spec or value is None:
+            continue
+        expected_type, allowed = spec[key]
+        checked = _coerce(value, expected_type)
+        if not isinstance(checked, expected_type) or (isinstance(checked, bool) and expected_type is not bool):
+            raise TypeError(f"{key} must be of type {expected_type.__name__}, got {value!r}")
+        if allowed is None or checked in allowed:
+            continue
+        if isinstance(allowed, range):
+            raise ValueError(f"{key} must be between {allowed.start} and {allowed.stop - 1}, got {value!r}")
+        raise ValueError(f"{key} must be one of {sorted(allowed)}, got {value!r}")
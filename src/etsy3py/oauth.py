@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from requests_oauthlib import OAuth2Session
 from requests.auth import HTTPBasicAuth
@@ -14,7 +14,7 @@ class EtsyOAuthClient(OAuth2Session):
     """
     def __init__(
             self, client_id: str, client_secret: str, redirect_uri: Optional[str] = None,
-            scope: Optional[list[str]] = None, code_verifier: Optional[str] = None
+            scope: Optional[List[str]] = None, code_verifier: Optional[str] = None
     ) -> None:
         """
         Initializes a new instance of the EtsyOAuthClient class.
@@ -33,8 +33,9 @@ class EtsyOAuthClient(OAuth2Session):
         )
         self.auth = HTTPBasicAuth(client_id, client_secret)
         self.code_verifier = code_verifier or str(self._client.create_code_verifier(128))
+        self._code_challenge = self._client.create_code_challenge(self.code_verifier, "S256")
 
-    def authorization_url(self, **kwargs) -> (str, str):
+    def authorization_url(self, **kwargs) -> Tuple[str, str]:
         """
         Returns the authorization URL for the OAuth2 flow with PKCE.
 
@@ -44,7 +45,7 @@ class EtsyOAuthClient(OAuth2Session):
         """
         authorization_url, state = super().authorization_url(
             self.authorization_url_base,
-            code_challenge=self._client.create_code_challenge(self.code_verifier, "S256"),
+            code_challenge=self._code_challenge,
             code_challenge_method="S256",
             **kwargs
         )
@@ -0,0 +1,23 @@
+from typing import Optional
+
+_BOOL = {True: 'true', False: 'false'}
+
+
+def _render(value):
+    # type() rather than isinstance(), and not a plain _BOOL lookup, as 1 == True would turn limit=1 into 'true'
+    if type(value) is bool:
+        return _BOOL[value]
+    if isinstance(value, (list, tuple)):
+        # Etsy takes array parameters as one comma separated value, requests and aiohttp would repeat the key instead
+        return ','.join(str(_render(item)) for item in value)
+    return value
+
+
+def prepare_params(params: Optional[dict] = None) -> Optional[dict]:
+    """
+    Drops query parameters set to None, renders booleans as the lowercase literals Etsy expects and joins lists
+    into comma separated values.
+    """
+    if not params:
+        return None
+    return {key: _render(value) for key, value in params.items() if value is not None}
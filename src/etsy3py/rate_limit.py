@@ -0,0 +1,75 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled with `rate` tokens per second, holding at most `capacity` tokens.
+    """
+    def __init__(self, rate: float = 10, capacity: float = 10) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self) -> None:
+        """
+        Blocks until a token is available and consumes it.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def update(self, remaining: Optional[float] = None, rate: Optional[float] = None) -> None:
+        """
+        Aligns the bucket with the quota reported by the server.
+
+        :param remaining: Optional[float] - the number of requests the server still accepts in the current window
+        :param rate: Optional[float] - the number of requests the server accepts per window
+        """
+        with self._lock:
+            self._refill()
+            if rate:
+                self.rate = self.capacity = rate
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+
+
+def backoff_delay(headers, attempt: int, max_backoff: float) -> float:
+    """
+    Returns the number of seconds to wait before retrying a throttled request:
+    the Retry-After header when present, otherwise an exponential backoff, capped at max_backoff.
+
+    :param headers: the case-insensitive headers of the 429 response
+    :param attempt: int - the number of retries made so far
+    :param max_backoff: float - the longest wait in seconds
+    """
+    try:
+        delay = float(headers['Retry-After'])
+    except (KeyError, ValueError):
+        delay = 2 ** attempt
+    return min(delay, max_backoff)
+
+
+def daily_quota_exhausted(headers) -> bool:
+    """
+    Tells whether a response reports that the app's daily quota is used up, retrying before it resets is pointless.
+
+    :param headers: the case-insensitive headers of the response
+    """
+    try:
+        return float(headers['X-Remaining-Today']) <= 0
+    except (KeyError, ValueError):
+        return False
@@ -0,0 +1,48 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj) -> bytes:
+    """
+    Serializes a request body to UTF-8 JSON, with orjson when it is installed.
+    orjson also accepts dataclasses, datetimes and numpy arrays / scalars, e.g. prices computed with numpy.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode('utf-8')
+
+
+class StreamedJSONBody:
+    """
+    JSON object body that serializes the items of its largest list one at a time, so the complete payload is never
+    held in memory at once. It is sent with chunked transfer encoding and can be iterated again when retried.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, obj: dict, key: str) -> None:
+        """
+        :param obj: dict - the body
+        :param key: str - the key of the list in obj to serialize item by item
+        """
+        self._obj = obj
+        self._key = key
+
+    def __iter__(self):
+        buffer = bytearray(b'{' + dumps(self._key) + b':[')
+        for i, item in enumerate(self._obj[self._key]):
+            if i:
+                buffer += b','
+            buffer += dumps(item)
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b']'
+        for key, value in self._obj.items():
+            if key != self._key:
+                buffer += b',' + dumps(key) + b':' + dumps(value)
+        buffer += b'}'
+        yield bytes(buffer)
@@ -1,32 +1,94 @@
-from typing import Optional, List
+from __future__ import annotations
 
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from etsy3py.base_client import BaseApiClient
+from etsy3py.cache import cached
+from etsy3py.endpoints import (
+    ME_PATH,
+    ACTIVE_LISTINGS_PATH,
+    LISTINGS_BATCH_PATH,
+    SHOP_RECEIPT_PATH,
+    SHOP_RECEIPTS_PATH,
+    RECEIPT_TRACKING_PATH,
+    LISTING_TRANSACTIONS_PATH,
+    RECEIPT_TRANSACTIONS_PATH,
+    SHOP_TRANSACTION_PATH,
+    SHOP_TRANSACTIONS_PATH,
+    LISTING_INVENTORY_PATH,
+    SHOP_LISTINGS_PATH,
+    LISTING_PATH,
+    SHOP_ACTIVE_LISTINGS_PATH,
+    SHOP_FEATURED_LISTINGS_PATH,
+    SHOP_LISTING_PROPERTY_PATH,
+    LISTING_PROPERTY_PATH,
+    SHOP_LISTING_PROPERTIES_PATH,
+    SHOP_LISTING_PATH,
+    RECEIPT_LISTINGS_PATH,
+    RETURN_POLICY_LISTINGS_PATH,
+    SHOP_SECTION_LISTINGS_PATH,
+    LISTING_OFFERING_PATH,
+    LISTING_PRODUCT_PATH,
+    LISTING_IDS_BATCH_SIZE,
+    PAGINATION_SPEC,
+    SHOP_RECEIPTS_SPEC,
+    SHOP_LISTINGS_SPEC,
+    LISTING_INVENTORY_SPEC,
+    validate_kwargs,
+)
+from etsy3py.serialization import StreamedJSONBody
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterator, Optional, List
+
+    import requests
 
 
 class EtsyApi(BaseApiClient):
-    def __init__(self, access_token: str, client_id: str, token_type: Optional[str] = 'Bearer') -> None:
+    __slots__ = ('_strict', '_me_cache')
+
+    def __init__(self, access_token: str, client_id: str, token_type: Optional[str] = 'Bearer',
+                 timeout: tuple = (5, 30), client_secret: Optional[str] = None, strict: bool = True,
+                 http2: bool = False) -> None:
         """
         Initialize EtsyApi.
         :param access_token: str - user access token
         :param client_id: str - client id, from ETSY developer platform
         :param token_type: str - default: bearer, token type
+        :param timeout: tuple - default: (5, 30), connect and read timeouts in seconds
+        :param client_secret: str - default: None, client secret, required only for basic authentication
+        :param strict: bool - default: True, validate documented parameter constraints before sending a request
+        :param http2: bool - default: False, send requests over HTTP/2 with httpx, requires the http2 extra
         """
-        super().__init__(access_token, client_id, token_type)
+        super().__init__(access_token, client_id, token_type, timeout, client_secret, http2)
+        self._strict = strict
+        self._me_cache: Optional[requests.Response] = None
 
     def get_me(self) -> requests.Response:
         """
         Returns basic info for the user making the request.
+        The first successful response is kept for the lifetime of the client, see invalidate_me.
         https://developers.etsy.com/documentation/reference#operation/getMe
         Scopes: 'shops_r'
 
         :return: requests.Response
         """
-        path = f"/v3/application/users/me"
+        if self._me_cache is not None:
+            return self._me_cache
+        path = ME_PATH
         r = self._get(path=path, auth_type='token')
+        if r.ok:
+            self._me_cache = r
         return r
 
+    def invalidate_me(self) -> None:
+        """
+        Drops the response kept by get_me, e.g. after the access token was exchanged for another user's.
+        """
+        self._me_cache = None
+
+    @cached(ttl=10, stale_if_error=True)
     def get_shop_receipt(self, shop_id: int, receipt_id: int) -> requests.Response:
         """
         Retrieves a receipt, identified by a receipt id, from an Etsy shop.
@@ -37,10 +99,24 @@ class EtsyApi(BaseApiClient):
         :param receipt_id: int - the numeric ID for the receipt associated to this transaction
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/receipts/{receipt_id}"
+        path = SHOP_RECEIPT_PATH(shop_id, receipt_id)
         r = self._get(path=path, auth_type='token')
         return r
 
+    def get_receipts_bulk(self, shop_id: int, receipt_ids: List[int], workers: int = 10) -> List[requests.Response]:
+        """
+        Retrieves many receipts from an Etsy shop concurrently. The calls are spread over a thread pool sharing the
+        session's connection pool and the client's rate limiter.
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param receipt_ids: List[int] - the numeric IDs of the receipts to retrieve
+        :param workers: int - default: 10, the number of threads issuing requests
+        :return: List[requests.Response] - in the same order as receipt_ids
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda receipt_id: self.get_shop_receipt(shop_id, receipt_id), receipt_ids))
+
     def update_shop_receipt(self, shop_id: int, receipt_id: int, **kwargs) -> requests.Response:
         """
         Updates the status of a receipt, identified by a receipt id, from an Etsy shop.
@@ -53,11 +129,13 @@ class EtsyApi(BaseApiClient):
         :key was_paid: Optional[bool] - default: None, when true, returns receipts where the seller has received payment for the receipt. When false, returns receipts where payment has not been received
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/receipts/{receipt_id}"
-        data = {**kwargs}
-        r = self._put(path=path, data=data, auth_type='token')
+        path = SHOP_RECEIPT_PATH(shop_id, receipt_id)
+        r = self._put(path=path, data=kwargs, auth_type='token')
+        EtsyApi.get_shop_receipt.cache_clear_for(self, shop_id, receipt_id)
+        EtsyApi.get_shop_receipts.cache_clear(self)
         return r
 
+    @cached(ttl=10, stale_if_error=True)
     def get_shop_receipts(self, shop_id: int, **kwargs) -> requests.Response:
         """
         Requests the Shop Receipts from a specific Shop, unfiltered or filtered by receipt id range or offset, date,
@@ -80,11 +158,69 @@ class EtsyApi(BaseApiClient):
         :return: requests.Response
         """
 
-        path = f"/v3/application/shops/{shop_id}/receipts"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        if self._strict:
+            validate_kwargs(SHOP_RECEIPTS_SPEC, kwargs)
+        path = SHOP_RECEIPTS_PATH(shop_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
+    def iter_paginated(self, method: Callable[..., requests.Response], *args, limit: int = 100,
+                       prefetch: bool = True, **kwargs) -> Iterator[dict]:
+        """
+        Lazily walks a limit/offset paginated endpoint, yielding every page as parsed JSON. With prefetch, the next
+        page is requested in the background while the caller processes the current one.
+
+        :param method: Callable - a paginated endpoint method of this client, e.g. self.get_shop_receipts
+        :param args: the positional arguments of the endpoint, e.g. shop_id
+        :param limit: int [1 .. 100] - default: 100, the number of results per page
+        :param prefetch: bool - default: True, request page N + 1 while page N is being consumed
+        :param kwargs: the remaining query parameters of the endpoint
+        :return: Iterator[dict] - pages with the "count" and "results" keys
+        """
+        def fetch(offset: int) -> dict:
+            response = method(*args, limit=limit, offset=offset, **kwargs)
+            response.raise_for_status()
+            return response.json()
+
+        def has_next(page: dict, next_offset: int) -> bool:
+            # A short page is the last one, even if count grew meanwhile
+            return next_offset < page['count'] and len(page['results']) >= limit
+
+        offset = 0
+        if not prefetch:
+            while True:
+                page = fetch(offset)
+                yield page
+                offset += limit
+                if not has_next(page, offset):
+                    return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(fetch, offset)
+            while True:
+                page = future.result()
+                offset += limit
+                more = has_next(page, offset)
+                if more:
+                    future = executor.submit(fetch, offset)
+                yield page
+                if not more:
+                    return
+        finally:
+            # An abandoned iteration does not wait for its prefetched page
+            executor.shutdown(wait=False)
+
+    def iter_shop_receipts(self, shop_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Lazily yields every page of get_shop_receipts as parsed JSON, see iter_paginated.
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :return: Iterator[dict] - pages with the "count" and "results" keys
+        """
+        return self.iter_paginated(self.get_shop_receipts, shop_id, **kwargs)
+
     def create_receipt_shipment(self, shop_id: int, receipt_id: int, **kwargs) -> requests.Response:
         """
         Submits tracking information for a Shop Receipt, which creates a Shop Receipt Shipment entry for the given
@@ -105,11 +241,13 @@ class EtsyApi(BaseApiClient):
         :key note_to_buyer: str - message to include in notification to the buyer
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/receipts/{receipt_id}/tracking"
-        data = {**kwargs}
-        r = self._post(path=path, data=data, auth_type='token')
+        path = RECEIPT_TRACKING_PATH(shop_id, receipt_id)
+        r = self._post(path=path, data=kwargs, auth_type='token')
+        EtsyApi.get_shop_receipt.cache_clear_for(self, shop_id, receipt_id)
+        EtsyApi.get_shop_receipts.cache_clear(self)
         return r
 
+    @cached(ttl=5)
     def get_shop_receipt_transactions_by_listing(self, shop_id: int, listing_id: int, **kwargs) -> requests.Response:
         """
         Retrieves the list of transactions associated with a listing.
@@ -122,11 +260,13 @@ class EtsyApi(BaseApiClient):
         :key offset: int - default: 0, the number of records to skip before selecting the first result
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings/{listing_id}/transactions"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        if self._strict:
+            validate_kwargs(PAGINATION_SPEC, kwargs)
+        path = LISTING_TRANSACTIONS_PATH(shop_id, listing_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
+    @cached(ttl=5)
     def get_shop_receipt_transactions_by_receipt(self, shop_id: int, receipt_id: int) -> requests.Response:
         """
         Retrieves the list of transactions associated with a specific receipt.
@@ -137,10 +277,11 @@ class EtsyApi(BaseApiClient):
         :param receipt_id: int - the numeric ID for the receipt associated to this transaction
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/receipts/{receipt_id}/transactions"
+        path = RECEIPT_TRANSACTIONS_PATH(shop_id, receipt_id)
         r = self._get(path=path, auth_type='token')
         return r
 
+    @cached(ttl=5)
     def get_shop_receipt_transaction(self, shop_id: int, transaction_id: int) -> requests.Response:
         """
         Retrieves a transaction by transaction ID.
@@ -151,10 +292,11 @@ class EtsyApi(BaseApiClient):
         :param transaction_id: int - the unique numeric ID for a transaction
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/transactions/{transaction_id}"
+        path = SHOP_TRANSACTION_PATH(shop_id, transaction_id)
         r = self._get(path=path, auth_type='token')
         return r
 
+    @cached(ttl=5)
     def get_shop_receipt_transactions_by_shop(self, shop_id: int, **kwargs) -> requests.Response:
         """
         Retrieves the list of transactions associated with a shop.
@@ -166,11 +308,13 @@ class EtsyApi(BaseApiClient):
         :key offset: int - default: 0, the number of records to skip before selecting the first result
         :return: requests.Response
         """
-        path = f"https://openapi.etsy.com/v3/application/shops/{shop_id}/transactions"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        if self._strict:
+            validate_kwargs(PAGINATION_SPEC, kwargs)
+        path = SHOP_TRANSACTIONS_PATH(shop_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
+    @cached(ttl=30, stale_if_error=True)
     def get_listing_inventory(self, listing_id: int, **kwargs) -> requests.Response:
         """
         Retrieves the inventory record for a listing. Listings you did not edit using the Etsy.com inventory tools have
@@ -184,12 +328,32 @@ class EtsyApi(BaseApiClient):
         :key show_deleted: bool - default: False, a boolean value for inventory whether to include deleted products and their offerings
         :return: requests.Response
         """
-        path = f"https://openapi.etsy.com/v3/application/listings/{listing_id}/inventory"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        if self._strict:
+            validate_kwargs(LISTING_INVENTORY_SPEC, kwargs)
+        path = LISTING_INVENTORY_PATH(listing_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    def get_listing_inventory_stream(self, listing_id: int, **kwargs) -> requests.Response:
+        """
+        Same as get_listing_inventory, without reading the body up front: large inventories can be parsed
+        incrementally from response.raw, e.g. with ijson. Responses are never cached, close them when done.
+        https://developers.etsy.com/documentation/reference/#operation/getListingInventory
+        Scopes: 'listings_r'
+
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :key includes: str Enum["Listing"] - default: None, an enumerated string that attaches a valid association
+        :key show_deleted: bool - default: False, a boolean value for inventory whether to include deleted products and their offerings
+        :return: requests.Response - with a decompressing, not yet consumed raw stream
+        """
+        if self._strict:
+            validate_kwargs(LISTING_INVENTORY_SPEC, kwargs)
+        path = LISTING_INVENTORY_PATH(listing_id)
+        r = self._get_stream(path=path, params=kwargs, auth_type='token')
         return r
 
-    def update_listing_inventory(self, listing_id: int, products: List[dict], **kwargs) -> requests.Response:
+    def update_listing_inventory(self, listing_id: int, products: List[dict], stream_body: bool = False,
+                                 **kwargs) -> requests.Response:
         """
         Updates the inventory for a listing identified by a listing ID. The update fails if the supplied values for
         product sku, offering quantity, and/or price are incompatible with values in *_on_property_* fields.
@@ -225,17 +389,19 @@ class EtsyApi(BaseApiClient):
 
         :param listing_id: int - the numeric ID for the listing associated to this transaction
         :param products: List[dict] - a JSON array of products available in a listing, even if only one product. All field names in the JSON blobs are lowercase
+        :param stream_body: bool - default: False, serialize products one at a time while sending, for very large inventories
         :key price_on_property: List[int] - an array of unique listing property ID integers for the properties that change product prices, if any. For example, if you charge specific prices for different sized products in the same listing, then this array contains the property ID for size
         :key quantity_on_property: List[int] - an array of unique listing property ID integers for the properties that change the quantity of the products, if any. For example, if you stock specific quantities of different colored products in the same listing, then this array contains the property ID for color
         :key sku_on_property: List[int] - an array of unique listing property ID integers for the properties that change the product SKU, if any. For example, if you use specific skus for different colored products in the same listing, then this array contains the property ID for color.
         :return: requests.Response
         """
-        path = f"/v3/application/listings/{listing_id}/inventory"
-        data = {
-            "products": products,
-            **kwargs
-        }
+        path = LISTING_INVENTORY_PATH(listing_id)
+        kwargs["products"] = products
+        # The whole inventory is replaced, so products must go in one request even when they are streamed
+        data = StreamedJSONBody(kwargs, "products") if stream_body else kwargs
         r = self._put(path=path, data=data, auth_type='token')
+        # Cached variants of the listing differ in their query parameters, drop them all
+        EtsyApi.get_listing_inventory.cache_clear(self)
         return r
 
     def create_draft_listing(self, shop_id: int, **kwargs) -> requests.Response:
@@ -247,9 +413,8 @@ class EtsyApi(BaseApiClient):
         :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings"
-        data = {**kwargs}
-        r = self._post(path=path, data=data, auth_type='token')
+        path = SHOP_LISTINGS_PATH(shop_id)
+        r = self._post(path=path, data=kwargs, auth_type='token')
         return r
 
     def get_listings_by_shop(self, shop_id: int, **kwargs) -> requests.Response:
@@ -259,11 +424,15 @@ class EtsyApi(BaseApiClient):
         Scopes: 'listings_r'
 
         :param shop_id:  int - the unique positive non-zero numeric ID for an Etsy Shop
+        :key state: str Enum["active", "inactive", "sold_out", "draft", "expired"] - default: "active", when _updating_ a listing, this value is the state of the listing
+        :key limit: int [1 .. 100] - default: 25, the maximum number of results to return
+        :key offset: int - default: 0, the number of records to skip before selecting the first result
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        if self._strict:
+            validate_kwargs(SHOP_LISTINGS_SPEC, kwargs)
+        path = SHOP_LISTINGS_PATH(shop_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
     def delete_listing(self, listing_id: int) -> requests.Response:
@@ -277,7 +446,7 @@ class EtsyApi(BaseApiClient):
         :param listing_id: int - the numeric ID for the listing associated to this transaction
         :return: requests.Response
         """
-        path = f"/v3/application/listings/{listing_id}"
+        path = LISTING_PATH(listing_id)
         r = self._delete(path=path, auth_type='token')
         return r
 
@@ -289,9 +458,8 @@ class EtsyApi(BaseApiClient):
         :param listing_id: int - the numeric ID for the listing associated to this transaction
         :return: requests.Response
         """
-        path = f"/v3/application/listings/{listing_id}"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        path = LISTING_PATH(listing_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
     def find_all_listings_active(self, **kwargs) -> requests.Response:
@@ -302,9 +470,8 @@ class EtsyApi(BaseApiClient):
 
         :return: requests.Response
         """
-        path = f"/v3/application/listings/active"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        path = ACTIVE_LISTINGS_PATH
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
     def find_all_active_listings_by_shop(self, shop_id: int, **kwargs) -> requests.Response:
@@ -315,9 +482,8 @@ class EtsyApi(BaseApiClient):
         :param shop_id:  int - the unique positive non-zero numeric ID for an Etsy Shop
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings/active"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        path = SHOP_ACTIVE_LISTINGS_PATH(shop_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
     def get_listings_by_listing_ids(self, listing_ids: List[int], **kwargs) -> requests.Response:
@@ -329,11 +495,29 @@ class EtsyApi(BaseApiClient):
         :key includes: List[str] Enum["Shipping", "Images", "Shop", "User", "Translations", "Inventory"] - default: None, an enumerated string that attaches a valid association
         :return: requests.Response
         """
-        path = f"/v3/application/listings/batch"
-        params = {"listing_ids": listing_ids, **kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        if self._strict and len(listing_ids) > LISTING_IDS_BATCH_SIZE:
+            raise ValueError(f"At most {LISTING_IDS_BATCH_SIZE} listing_ids are accepted per call, "
+                             f"got {len(listing_ids)}, use get_listings_bulk instead")
+        path = LISTINGS_BATCH_PATH
+        kwargs["listing_ids"] = listing_ids
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
+    def get_listings_bulk(self, listing_ids: List[int], max_workers: int = 8, **kwargs) -> List[requests.Response]:
+        """
+        Retrieves any number of listings by splitting listing_ids into batches of 100 for get_listings_by_listing_ids
+        and issuing the batches concurrently over a thread pool.
+
+        :param listing_ids: List[int] - the numeric IDs of the listings to retrieve
+        :param max_workers: int - default: 8, the number of threads issuing requests
+        :key includes: List[str] Enum["Shipping", "Images", "Shop", "User", "Translations", "Inventory"] - default: None, an enumerated string that attaches a valid association
+        :return: List[requests.Response] - one response per batch, in the order of listing_ids
+        """
+        batches = [listing_ids[i:i + LISTING_IDS_BATCH_SIZE]
+                   for i in range(0, len(listing_ids), LISTING_IDS_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda batch: self.get_listings_by_listing_ids(batch, **kwargs), batches))
+
     def get_featured_listings_by_shop(self, shop_id: int, **kwargs) -> requests.Response:
         """
         Retrieves Listings associated to a Shop that are featured.
@@ -344,9 +528,10 @@ class EtsyApi(BaseApiClient):
         :key offset: int - default: 0, the number of records to skip before selecting the first result
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings/featured"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        if self._strict:
+            validate_kwargs(PAGINATION_SPEC, kwargs)
+        path = SHOP_FEATURED_LISTINGS_PATH(shop_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
     def delete_listing_property(self, shop_id: int, listing_id: int, property_id: int) -> requests.Response:
@@ -360,8 +545,10 @@ class EtsyApi(BaseApiClient):
         :param property_id: int - the unique ID of an Etsy listing property
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings/{listing_id}/properties/{property_id}"
+        path = SHOP_LISTING_PROPERTY_PATH(shop_id, listing_id, property_id)
         r = self._delete(path=path, auth_type='token')
+        EtsyApi.get_listing_property.cache_clear_for(self, listing_id, property_id)
+        EtsyApi.get_listing_properties.cache_clear_for(self, shop_id, listing_id)
         return r
 
     def update_listing_property(self, shop_id: int, listing_id: int, property_id: int,
@@ -380,15 +567,15 @@ class EtsyApi(BaseApiClient):
         :param values: List[str] - an array of value strings for multiple Etsy listing property values. For example, if your listing offers different colored products, then the values array contains the color strings for each color. Note: parenthesis characters (( and )) are not allowed
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings/{listing_id}/properties/{property_id}"
-        data = {
-            "value_ids": value_ids,
-            "values": values,
-            **kwargs
-        }
-        r = self._put(path=path, data=data, auth_type='token')
+        path = SHOP_LISTING_PROPERTY_PATH(shop_id, listing_id, property_id)
+        kwargs["value_ids"] = value_ids
+        kwargs["values"] = values
+        r = self._put(path=path, data=kwargs, auth_type='token')
+        EtsyApi.get_listing_property.cache_clear_for(self, listing_id, property_id)
+        EtsyApi.get_listing_properties.cache_clear_for(self, shop_id, listing_id)
         return r
 
+    @cached(ttl=60)
     def get_listing_property(self, listing_id: int, property_id: int) -> requests.Response:
         """
         Retrieves a listing's property.
@@ -398,10 +585,11 @@ class EtsyApi(BaseApiClient):
         :param property_id: int - the unique ID of an Etsy listing property
         :return: requests.Response
         """
-        path = f"/v3/application/listings/{listing_id}/properties/{property_id}"
+        path = LISTING_PROPERTY_PATH(listing_id, property_id)
         r = self._get(path=path, auth_type='token')
         return r
 
+    @cached(ttl=60)
     def get_listing_properties(self, shop_id: int, listing_id: int) -> requests.Response:
         """
         Get a listing's properties.
@@ -411,7 +599,7 @@ class EtsyApi(BaseApiClient):
         :param listing_id: int - the numeric ID for the listing associated to this transaction
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings/{listing_id}/properties"
+        path = SHOP_LISTING_PROPERTIES_PATH(shop_id, listing_id)
         r = self._get(path=path, auth_type='token')
         return r
 
@@ -426,9 +614,8 @@ class EtsyApi(BaseApiClient):
         :param listing_id: int - the numeric ID for the listing associated to this transaction
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/listings/{listing_id}"
-        data = {**kwargs}
-        r = self._patch(path=path, data=data, auth_type='token')
+        path = SHOP_LISTING_PATH(shop_id, listing_id)
+        r = self._patch(path=path, data=kwargs, auth_type='token')
         return r
 
     def get_listings_by_shop_receipt(self, receipt_id: int, shop_id: int, **kwargs) -> requests.Response:
@@ -443,9 +630,8 @@ class EtsyApi(BaseApiClient):
         :key offset: int - default: 0, the number of records to skip before selecting the first result
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/receipts/{receipt_id}/listings"
-        params = {**kwargs}
-        r = self._get(path=path, params=params, auth_type='token')
+        path = RECEIPT_LISTINGS_PATH(shop_id, receipt_id)
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
     def get_listings_by_shop_return_policy(self, return_policy_id: int, shop_id: int) -> requests.Response:
@@ -458,7 +644,7 @@ class EtsyApi(BaseApiClient):
         :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/policies/return/{return_policy_id}/listings"
+        path = RETURN_POLICY_LISTINGS_PATH(shop_id, return_policy_id)
         r = self._get(path=path, auth_type='token')
         return r
 
@@ -471,12 +657,9 @@ class EtsyApi(BaseApiClient):
         :param shop_section_ids: List[int] - a list of numeric IDS for all sections in a specific Etsy shop
         :return: requests.Response
         """
-        path = f"/v3/application/shops/{shop_id}/shop-sections/listings"
-        params = {
-            "shop_section_ids": shop_section_ids,
-            **kwargs
-        }
-        r = self._get(path=path, params=params, auth_type='token')
+        path = SHOP_SECTION_LISTINGS_PATH(shop_id)
+        kwargs["shop_section_ids"] = shop_section_ids
+        r = self._get(path=path, params=kwargs, auth_type='token')
         return r
 
     def get_listing_offering(self, listing_id: int, product_id: int, product_offering_id: int) -> requests.Response:
@@ -489,7 +672,7 @@ class EtsyApi(BaseApiClient):
         :param product_offering_id: int
         :return: requests.Response
         """
-        path = f"/v3/application/listings/{listing_id}/products/{product_id}/offerings/{product_offering_id}"
+        path = LISTING_OFFERING_PATH(listing_id, product_id, product_offering_id)
         r = self._get(path=path, auth_type='token')
         return r
 
@@ -503,6 +686,6 @@ class EtsyApi(BaseApiClient):
         :param product_id: int - the numeric ID for a specific product purchased from a listing
         :return: requests.Response
         """
-        path = f"/v3/application/listings/{listing_id}/inventory/products/{product_id}"
+        path = LISTING_PRODUCT_PATH(listing_id, product_id)
         r = self._get(path=path, auth_type='token')
         return r
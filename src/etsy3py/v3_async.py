@@ -0,0 +1,681 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional, List
+
+import aiohttp
+
+from etsy3py.async_base_client import AsyncBaseApiClient
+from etsy3py.endpoints import (
+    ME_PATH,
+    ACTIVE_LISTINGS_PATH,
+    LISTINGS_BATCH_PATH,
+    SHOP_RECEIPT_PATH,
+    SHOP_RECEIPTS_PATH,
+    RECEIPT_TRACKING_PATH,
+    LISTING_TRANSACTIONS_PATH,
+    RECEIPT_TRANSACTIONS_PATH,
+    SHOP_TRANSACTION_PATH,
+    SHOP_TRANSACTIONS_PATH,
+    LISTING_INVENTORY_PATH,
+    SHOP_LISTINGS_PATH,
+    LISTING_PATH,
+    SHOP_ACTIVE_LISTINGS_PATH,
+    SHOP_FEATURED_LISTINGS_PATH,
+    SHOP_LISTING_PROPERTY_PATH,
+    LISTING_PROPERTY_PATH,
+    SHOP_LISTING_PROPERTIES_PATH,
+    SHOP_LISTING_PATH,
+    RECEIPT_LISTINGS_PATH,
+    RETURN_POLICY_LISTINGS_PATH,
+    SHOP_SECTION_LISTINGS_PATH,
+    LISTING_OFFERING_PATH,
+    LISTING_PRODUCT_PATH,
+    LISTING_IDS_BATCH_SIZE,
+    PAGINATION_SPEC,
+    SHOP_RECEIPTS_SPEC,
+    SHOP_LISTINGS_SPEC,
+    LISTING_INVENTORY_SPEC,
+    validate_kwargs,
+)
+
+
+class AsyncEtsyApi(AsyncBaseApiClient):
+    __slots__ = ('_strict', '_me_cache')
+
+    max_page_concurrency = 8
+
+    def __init__(self, access_token: str, client_id: str, token_type: Optional[str] = 'Bearer',
+                 client_secret: Optional[str] = None, strict: bool = True) -> None:
+        """
+        Initialize AsyncEtsyApi.
+        :param access_token: str - user access token
+        :param client_id: str - client id, from ETSY developer platform
+        :param token_type: str - default: bearer, token type
+        :param client_secret: str - default: None, client secret, required only for basic authentication
+        :param strict: bool - default: True, validate documented parameter constraints before sending a request
+        """
+        super().__init__(access_token, client_id, token_type, client_secret)
+        self._strict = strict
+        self._me_cache: Optional[aiohttp.ClientResponse] = None
+
+    async def get_me(self) -> aiohttp.ClientResponse:
+        """
+        Returns basic info for the user making the request.
+        The first successful response is kept for the lifetime of the client, see invalidate_me.
+        https://developers.etsy.com/documentation/reference#operation/getMe
+        Scopes: 'shops_r'
+
+        :return: aiohttp.ClientResponse
+        """
+        if self._me_cache is not None:
+            return self._me_cache
+        path = ME_PATH
+        r = await self._get(path=path, auth_type='token')
+        if r.ok:
+            self._me_cache = r
+        return r
+
+    def invalidate_me(self) -> None:
+        """
+        Drops the response kept by get_me, e.g. after the access token was exchanged for another user's.
+        """
+        self._me_cache = None
+
+    async def get_shop_receipt(self, shop_id: int, receipt_id: int) -> aiohttp.ClientResponse:
+        """
+        Retrieves a receipt, identified by a receipt id, from an Etsy shop.
+        https://developers.etsy.com/documentation/reference/#operation/getShopReceipt
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param receipt_id: int - the numeric ID for the receipt associated to this transaction
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_RECEIPT_PATH(shop_id, receipt_id)
+        r = await self._get(path=path, auth_type='token')
+        return r
+
+    async def update_shop_receipt(self, shop_id: int, receipt_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Updates the status of a receipt, identified by a receipt id, from an Etsy shop.
+        https://developers.etsy.com/documentation/reference/#operation/updateShopReceipt
+        Scopes: 'transactions_w'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param receipt_id: int - the numeric ID for the receipt associated to this transaction
+        :key was_shipped: Optional[bool] - default: None, when true, returns receipts where the seller shipped the product(s) in this receipt. When false, returns receipts where shipment has not been set
+        :key was_paid: Optional[bool] - default: None, when true, returns receipts where the seller has received payment for the receipt. When false, returns receipts where payment has not been received
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_RECEIPT_PATH(shop_id, receipt_id)
+        r = await self._put(path=path, data=kwargs, auth_type='token')
+        return r
+
+    async def get_shop_receipts(self, shop_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Requests the Shop Receipts from a specific Shop, unfiltered or filtered by receipt id range or offset, date,
+        paid, and/or shipped purchases.
+        https://developers.etsy.com/documentation/reference/#operation/getShopReceipts
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :key min_created: int - default: None, the earliest unix timestamp for when a record was created
+        :key max_created: int - default: None, the latest unix timestamp for when a record was created
+        :key min_last_modified: int - default: None, the earliest unix timestamp for when a record last changed
+        :key max_last_modified: int - default: None, the latest unix timestamp for when a record last changed
+        :key limit: int [1 .. 100] - default: 25, the maximum number of results to return
+        :key offset: int - default: 0, the number of records to skip before selecting the first result
+        :key sort_on: str Enum["created", "updated", "receipt_id"] - default: "created", the value to sort a search result of listings on
+        :key sort_order: str Enum["asc", "ascending", "desc", "descending", "up", "down"] - default: "desc", the ascending(up) or descending(down) order to sort receipts by
+        :key was_paid: bool - when true, returns receipts where the seller has received payment for the receipt. When false, returns receipts where payment has not been received
+        :key was_shipped: bool - when true, returns receipts where the seller shipped the product(s) in this receipt. When false, returns receipts where shipment has not been set
+        :key was_delivered: bool - when true, returns receipts that have been marked as delivered. When false, returns receipts where shipment has not been marked as delivered
+        :return: aiohttp.ClientResponse
+        """
+
+        if self._strict:
+            validate_kwargs(SHOP_RECEIPTS_SPEC, kwargs)
+        path = SHOP_RECEIPTS_PATH(shop_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def gather_paginated(self, method: Callable[..., Awaitable[aiohttp.ClientResponse]], *args,
+                               limit: int = 100, **kwargs) -> List[dict]:
+        """
+        Retrieves every page of a limit/offset paginated endpoint as parsed JSON. Once the first page reveals the
+        total count, the remaining pages are requested concurrently, at most max_page_concurrency at a time.
+
+        :param method: Callable - a paginated endpoint method of this client, e.g. self.get_shop_receipts
+        :param args: the positional arguments of the endpoint, e.g. shop_id
+        :param limit: int [1 .. 100] - default: 100, the number of results per page
+        :param kwargs: the remaining query parameters of the endpoint
+        :return: List[dict] - pages with the "count" and "results" keys, in offset order
+        """
+        async def fetch(offset: int) -> dict:
+            async with semaphore:
+                response = await method(*args, limit=limit, offset=offset, **kwargs)
+            response.raise_for_status()
+            return await self._json(response)
+
+        semaphore = asyncio.Semaphore(self.max_page_concurrency)
+        first_page = await fetch(0)
+        pages = await asyncio.gather(*[fetch(offset) for offset in range(limit, first_page['count'], limit)])
+        return [first_page, *pages]
+
+    async def gather_shop_receipts(self, shop_id: int, **kwargs) -> List[dict]:
+        """
+        Retrieves every page of get_shop_receipts as parsed JSON, see gather_paginated.
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :return: List[dict] - pages with the "count" and "results" keys, in offset order
+        """
+        return await self.gather_paginated(self.get_shop_receipts, shop_id, **kwargs)
+
+    async def create_receipt_shipment(self, shop_id: int, receipt_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Submits tracking information for a Shop Receipt, which creates a Shop Receipt Shipment entry for the given
+        receipt_id. Each time you successfully submit tracking info, Etsy sends a notification email to the buyer User.
+        When send_bcc is true, Etsy sends shipping notifications to the seller as well. When tracking_code and
+        carrier_name aren't sent, the receipt is marked as shipped only. If the carrier is not supported, you may use
+        other as the carrier name, so you can provide the tracking code.
+        **NOTE** When shipping within the United States AND the order is over $10 or when shipping to India, tracking
+        code and carrier name ARE required.
+        https://developers.etsy.com/documentation/reference/#operation/createReceiptShipment
+        Scopes: 'transactions_w'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param receipt_id: int - the receipt to submit tracking for
+        :key tracking_code: str - the tracking code for this receipt
+        :key carrier_name: str - the carrier name for this receipt
+        :key send_bcc: bool - if true, the shipping notification will be sent to the seller as well
+        :key note_to_buyer: str - message to include in notification to the buyer
+        :return: aiohttp.ClientResponse
+        """
+        path = RECEIPT_TRACKING_PATH(shop_id, receipt_id)
+        r = await self._post(path=path, data=kwargs, auth_type='token')
+        return r
+
+    async def get_shop_receipt_transactions_by_listing(self, shop_id: int, listing_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Retrieves the list of transactions associated with a listing.
+        https://developers.etsy.com/documentation/reference/#operation/getShopReceiptTransactionsByListing
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :key limit: int [1 .. 100] - default: 25, the maximum number of results to return
+        :key offset: int - default: 0, the number of records to skip before selecting the first result
+        :return: aiohttp.ClientResponse
+        """
+        if self._strict:
+            validate_kwargs(PAGINATION_SPEC, kwargs)
+        path = LISTING_TRANSACTIONS_PATH(shop_id, listing_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def get_shop_receipt_transactions_by_receipt(self, shop_id: int, receipt_id: int) -> aiohttp.ClientResponse:
+        """
+        Retrieves the list of transactions associated with a specific receipt.
+        https://developers.etsy.com/documentation/reference/#operation/getShopReceiptTransactionsByReceipt
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param receipt_id: int - the numeric ID for the receipt associated to this transaction
+        :return: aiohttp.ClientResponse
+        """
+        path = RECEIPT_TRANSACTIONS_PATH(shop_id, receipt_id)
+        r = await self._get(path=path, auth_type='token')
+        return r
+
+    async def get_shop_receipt_transaction(self, shop_id: int, transaction_id: int) -> aiohttp.ClientResponse:
+        """
+        Retrieves a transaction by transaction ID.
+        https://developers.etsy.com/documentation/reference/#operation/getShopReceiptTransaction
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param transaction_id: int - the unique numeric ID for a transaction
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_TRANSACTION_PATH(shop_id, transaction_id)
+        r = await self._get(path=path, auth_type='token')
+        return r
+
+    async def get_shop_receipt_transactions_by_shop(self, shop_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Retrieves the list of transactions associated with a shop.
+        https://developers.etsy.com/documentation/reference/#operation/getShopReceiptTransactionsByShop
+        Scopes: 'transactions_r'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :key limit: int [1 .. 100] - default: 25, the maximum number of results to return
+        :key offset: int - default: 0, the number of records to skip before selecting the first result
+        :return: aiohttp.ClientResponse
+        """
+        if self._strict:
+            validate_kwargs(PAGINATION_SPEC, kwargs)
+        path = SHOP_TRANSACTIONS_PATH(shop_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def get_listing_inventory(self, listing_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Retrieves the inventory record for a listing. Listings you did not edit using the Etsy.com inventory tools have
+        no inventory records. This endpoint returns SKU data if you are the owner of the inventory records being
+        fetched.
+        https://developers.etsy.com/documentation/reference/#operation/getListingInventory
+        Scopes: 'listings_r'
+
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :key includes: str Enum["Listing"] - default: None, an enumerated string that attaches a valid association
+        :key show_deleted: bool - default: False, a boolean value for inventory whether to include deleted products and their offerings
+        :return: aiohttp.ClientResponse
+        """
+        if self._strict:
+            validate_kwargs(LISTING_INVENTORY_SPEC, kwargs)
+        path = LISTING_INVENTORY_PATH(listing_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def update_listing_inventory(self, listing_id: int, products: List[dict], **kwargs) -> aiohttp.ClientResponse:
+        """
+        Updates the inventory for a listing identified by a listing ID. The update fails if the supplied values for
+        product sku, offering quantity, and/or price are incompatible with values in *_on_property_* fields.
+        When setting a price, assign a float equal to amount divided by divisor as specified in the Money resource.
+        https://developers.etsy.com/documentation/reference/#operation/updateListingInventory
+        Scopes: 'listings_w'
+
+        "products": [
+            {
+              "sku": "string",
+              "property_values": [
+                {
+                  "property_id": 1,
+                  "value_ids": [
+                    1
+                  ],
+                  "scale_id": 1,
+                  "property_name": "string",
+                  "values": [
+                    "string"
+                  ]
+                }
+              ],
+              "offerings": [
+                {
+                  "price": 0,
+                  "quantity": 0,
+                  "is_enabled": true
+                }
+              ]
+            }
+        ]
+
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :param products: List[dict] - a JSON array of products available in a listing, even if only one product. All field names in the JSON blobs are lowercase
+        :key price_on_property: List[int] - an array of unique listing property ID integers for the properties that change product prices, if any. For example, if you charge specific prices for different sized products in the same listing, then this array contains the property ID for size
+        :key quantity_on_property: List[int] - an array of unique listing property ID integers for the properties that change the quantity of the products, if any. For example, if you stock specific quantities of different colored products in the same listing, then this array contains the property ID for color
+        :key sku_on_property: List[int] - an array of unique listing property ID integers for the properties that change the product SKU, if any. For example, if you use specific skus for different colored products in the same listing, then this array contains the property ID for color.
+        :return: aiohttp.ClientResponse
+        """
+        path = LISTING_INVENTORY_PATH(listing_id)
+        kwargs["products"] = products
+        r = await self._put(path=path, data=kwargs, auth_type='token')
+        return r
+
+    async def create_draft_listing(self, shop_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Creates a physical draft listing product in a shop on the Etsy channel.
+        https://developers.etsy.com/documentation/reference#operation/createDraftListing
+        Scopes: 'listings_w'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_LISTINGS_PATH(shop_id)
+        r = await self._post(path=path, data=kwargs, auth_type='token')
+        return r
+
+    async def get_listings_by_shop(self, shop_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Endpoint to list Listings that belong to a Shop. Listings can be filtered using the 'state' param.
+        https://developers.etsy.com/documentation/reference#operation/getListingsByShop
+        Scopes: 'listings_r'
+
+        :param shop_id:  int - the unique positive non-zero numeric ID for an Etsy Shop
+        :key state: str Enum["active", "inactive", "sold_out", "draft", "expired"] - default: "active", when _updating_ a listing, this value is the state of the listing
+        :key limit: int [1 .. 100] - default: 25, the maximum number of results to return
+        :key offset: int - default: 0, the number of records to skip before selecting the first result
+        :return: aiohttp.ClientResponse
+        """
+        if self._strict:
+            validate_kwargs(SHOP_LISTINGS_SPEC, kwargs)
+        path = SHOP_LISTINGS_PATH(shop_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def delete_listing(self, listing_id: int) -> aiohttp.ClientResponse:
+        """
+        Open API V3 endpoint to delete a ShopListing. A ShopListing can be deleted only if the state is one of the
+        following: SOLD_OUT, DRAFT, EXPIRED, INACTIVE, ACTIVE and is_available or ACTIVE and has seller flags:
+        SUPPRESSED (frozen), VACATION, CUSTOM_SHOPS (pattern), SELL_ON_FACEBOOK.
+        https://developers.etsy.com/documentation/reference#operation/deleteListing
+        Scopes: 'listings_d'
+
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :return: aiohttp.ClientResponse
+        """
+        path = LISTING_PATH(listing_id)
+        r = await self._delete(path=path, auth_type='token')
+        return r
+
+    async def get_listing(self, listing_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Retrieves a listing record by listing ID.
+        https://developers.etsy.com/documentation/reference#operation/getListing
+
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :return: aiohttp.ClientResponse
+        """
+        path = LISTING_PATH(listing_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def find_all_listings_active(self, **kwargs) -> aiohttp.ClientResponse:
+        """
+        A list of all active listings on Etsy paginated by their creation date. Without sort_order listings will be
+        returned newest-first by default.
+        https://developers.etsy.com/documentation/reference#operation/findAllListingsActive
+
+        :return: aiohttp.ClientResponse
+        """
+        path = ACTIVE_LISTINGS_PATH
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def find_all_active_listings_by_shop(self, shop_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Retrieves a list of all active listings on Etsy in a specific shop, paginated by listing creation date.
+        https://developers.etsy.com/documentation/reference#operation/findAllActiveListingsByShop
+
+        :param shop_id:  int - the unique positive non-zero numeric ID for an Etsy Shop
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_ACTIVE_LISTINGS_PATH(shop_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def get_listings_by_listing_ids(self, listing_ids: List[int], **kwargs) -> aiohttp.ClientResponse:
+        """
+        Allows to query multiple listing ids at once. Limit 100 ids maximum per query.
+        https://developers.etsy.com/documentation/reference#operation/getListingsByListingIds
+
+        :param listing_ids: List[int] - the list of numeric IDS for the listings in a specific Etsy shop
+        :key includes: List[str] Enum["Shipping", "Images", "Shop", "User", "Translations", "Inventory"] - default: None, an enumerated string that attaches a valid association
+        :return: aiohttp.ClientResponse
+        """
+        if self._strict and len(listing_ids) > LISTING_IDS_BATCH_SIZE:
+            raise ValueError(f"At most {LISTING_IDS_BATCH_SIZE} listing_ids are accepted per call, "
+                             f"got {len(listing_ids)}, use get_listings_bulk instead")
+        path = LISTINGS_BATCH_PATH
+        kwargs["listing_ids"] = listing_ids
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def get_listings_bulk(self, listing_ids: List[int], **kwargs) -> List[aiohttp.ClientResponse]:
+        """
+        Retrieves any number of listings by splitting listing_ids into batches of 100 for get_listings_by_listing_ids
+        and issuing the batches concurrently.
+
+        :param listing_ids: List[int] - the numeric IDs of the listings to retrieve
+        :key includes: List[str] Enum["Shipping", "Images", "Shop", "User", "Translations", "Inventory"] - default: None, an enumerated string that attaches a valid association
+        :return: List[aiohttp.ClientResponse] - one response per batch, in the order of listing_ids
+        """
+        batches = [listing_ids[i:i + LISTING_IDS_BATCH_SIZE]
+                   for i in range(0, len(listing_ids), LISTING_IDS_BATCH_SIZE)]
+        return await asyncio.gather(*[self.get_listings_by_listing_ids(batch, **kwargs) for batch in batches])
+
+    async def get_featured_listings_by_shop(self, shop_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Retrieves Listings associated to a Shop that are featured.
+        https://developers.etsy.com/documentation/reference#operation/getFeaturedListingsByShop
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :key limit: int [1 .. 100] - default: 25, the maximum number of results to return
+        :key offset: int - default: 0, the number of records to skip before selecting the first result
+        :return: aiohttp.ClientResponse
+        """
+        if self._strict:
+            validate_kwargs(PAGINATION_SPEC, kwargs)
+        path = SHOP_FEATURED_LISTINGS_PATH(shop_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def delete_listing_property(self, shop_id: int, listing_id: int, property_id: int) -> aiohttp.ClientResponse:
+        """
+        Deletes a property for a Listing.
+        https://developers.etsy.com/documentation/reference#operation/deleteListingProperty
+        Scopes: 'listings_w'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :param property_id: int - the unique ID of an Etsy listing property
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_LISTING_PROPERTY_PATH(shop_id, listing_id, property_id)
+        r = await self._delete(path=path, auth_type='token')
+        return r
+
+    async def update_listing_property(self, shop_id: int, listing_id: int, property_id: int,
+                                value_ids: List[int], values: List[str], **kwargs) -> aiohttp.ClientResponse:
+        """
+        Updates or populates the properties list defining product offerings for a listing.
+        Each offering requires both a `value` and a `value_id` that are valid for a `scale_id` assigned to the listing
+        or that you assign to the listing with this request.
+        https://developers.etsy.com/documentation/reference#operation/updateListingProperty
+        Scopes: 'listings_w'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :param property_id: int - the unique ID of an Etsy listing property
+        :param value_ids: List[int] - an array of unique IDs of multiple Etsy listing property values. For example, if your listing offers different sizes of a product, then the value ID list contains value IDs for each size
+        :param values: List[str] - an array of value strings for multiple Etsy listing property values. For example, if your listing offers different colored products, then the values array contains the color strings for each color. Note: parenthesis characters (( and )) are not allowed
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_LISTING_PROPERTY_PATH(shop_id, listing_id, property_id)
+        kwargs["value_ids"] = value_ids
+        kwargs["values"] = values
+        r = await self._put(path=path, data=kwargs, auth_type='token')
+        return r
+
+    async def get_listing_property(self, listing_id: int, property_id: int) -> aiohttp.ClientResponse:
+        """
+        Retrieves a listing's property.
+        https://developers.etsy.com/documentation/reference#operation/getListingProperty
+
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :param property_id: int - the unique ID of an Etsy listing property
+        :return: aiohttp.ClientResponse
+        """
+        path = LISTING_PROPERTY_PATH(listing_id, property_id)
+        r = await self._get(path=path, auth_type='token')
+        return r
+
+    async def get_listing_properties(self, shop_id: int, listing_id: int) -> aiohttp.ClientResponse:
+        """
+        Get a listing's properties.
+        https://developers.etsy.com/documentation/reference#operation/getListingProperties
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_LISTING_PROPERTIES_PATH(shop_id, listing_id)
+        r = await self._get(path=path, auth_type='token')
+        return r
+
+    async def update_listing(self, shop_id: int, listing_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Updates a listing, identified by a listing ID, for a specific shop identified by a shop ID. Note that this is a
+        PATCH method type.
+        https://developers.etsy.com/documentation/reference#operation/updateListing
+        Scores: 'listings_w'
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_LISTING_PATH(shop_id, listing_id)
+        r = await self._patch(path=path, data=kwargs, auth_type='token')
+        return r
+
+    async def get_listings_by_shop_receipt(self, receipt_id: int, shop_id: int, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Gets all listings associated with a receipt.
+        https://developers.etsy.com/documentation/reference#operation/getListingsByShopReceipt
+        Scopes: 'transactions_r'
+
+        :param receipt_id: int - the numeric ID for the receipt associated to this transaction
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :key limit: int [1 .. 100] - default: 25, the maximum number of results to return
+        :key offset: int - default: 0, the number of records to skip before selecting the first result
+        :return: aiohttp.ClientResponse
+        """
+        path = RECEIPT_LISTINGS_PATH(shop_id, receipt_id)
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def get_listings_by_shop_return_policy(self, return_policy_id: int, shop_id: int) -> aiohttp.ClientResponse:
+        """
+        Gets all listings associated with a Return Policy.
+        https://developers.etsy.com/documentation/reference#operation/getListingsByShopReturnPolicy
+        Scopes: 'listings_r'
+
+        :param return_policy_id: int - the numeric ID of the Return Policy
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :return: aiohttp.ClientResponse
+        """
+        path = RETURN_POLICY_LISTINGS_PATH(shop_id, return_policy_id)
+        r = await self._get(path=path, auth_type='token')
+        return r
+
+    async def get_listings_by_shop_section_id(self, shop_id: int, shop_section_ids: List[int], **kwargs) -> aiohttp.ClientResponse:
+        """
+        Retrieves all the listings from the section of a specific shop.
+        https://developers.etsy.com/documentation/reference#operation/getListingsByShopSectionId
+
+        :param shop_id: int - the unique positive non-zero numeric ID for an Etsy Shop
+        :param shop_section_ids: List[int] - a list of numeric IDS for all sections in a specific Etsy shop
+        :return: aiohttp.ClientResponse
+        """
+        path = SHOP_SECTION_LISTINGS_PATH(shop_id)
+        kwargs["shop_section_ids"] = shop_section_ids
+        r = await self._get(path=path, params=kwargs, auth_type='token')
+        return r
+
+    async def get_listing_offering(self, listing_id: int, product_id: int, product_offering_id: int) -> aiohttp.ClientResponse:
+        """
+        Get an Offering for a Listing.
+        https://developers.etsy.com/documentation/reference/#operation/getListingOffering
+
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :param product_id: int - the numeric ID for a specific product purchased from a listing
+        :param product_offering_id: int
+        :return: aiohttp.ClientResponse
+        """
+        path = LISTING_OFFERING_PATH(listing_id, product_id, product_offering_id)
+        r = await self._get(path=path, auth_type='token')
+        return r
+
+    async def get_listing_product(self, listing_id: int, product_id: int) -> aiohttp.ClientResponse:
+        """
+        Open API V3 endpoint to retrieve a ListingProduct by ID.
+        https://developers.etsy.com/documentation/reference/#operation/getListingProduct
+        Scopes: 'listings_r'
+
+        :param listing_id: int - the numeric ID for the listing associated to this transaction
+        :param product_id: int - the numeric ID for a specific product purchased from a listing
+        :return: aiohttp.ClientResponse
+        """
+        path = LISTING_PRODUCT_PATH(listing_id, product_id)
+        r = await self._get(path=path, auth_type='token')
+        return r
+
+
+class BatchingEtsyApi(AsyncEtsyApi):
+    """
+    AsyncEtsyApi that coalesces single listing lookups.
+
+    Listings requested through load_listing within batch_window seconds of each other are fetched together with
+    getListingsByListingIds, 100 per request, instead of one getListing request each.
+    """
+    __slots__ = ('_pending', '_flush_task')
+
+    batch_window = 0.05
+
+    def __init__(self, access_token: str, client_id: str, token_type: Optional[str] = 'Bearer',
+                 client_secret: Optional[str] = None, strict: bool = True) -> None:
+        """
+        Initialize BatchingEtsyApi.
+        :param access_token: str - user access token
+        :param client_id: str - client id, from ETSY developer platform
+        :param token_type: str - default: bearer, token type
+        :param client_secret: str - default: None, client secret, required only for basic authentication
+        :param strict: bool - default: True, validate documented parameter constraints before sending a request
+        """
+        super().__init__(access_token, client_id, token_type, client_secret, strict)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def load_listing(self, listing_id: int) -> Optional[dict]:
+        """
+        Returns a listing, batched with the other listings requested in the same window.
+        Concurrent calls for the same listing share one lookup.
+        Scopes: 'listings_r'
+
+        :param listing_id: int - the numeric ID for the listing
+        :return: Optional[dict] - the listing, None if Etsy did not return it, e.g. because it is not active
+        """
+        future = self._pending.get(listing_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[listing_id] = loop.create_future()
+            if self._flush_task is None:
+                self._flush_task = loop.create_task(self._flush())
+        # A cancelled caller must not cancel the lookup for the others waiting on the same listing
+        return await asyncio.shield(future)
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self.batch_window)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        listing_ids = list(pending)
+        batches = [listing_ids[i:i + LISTING_IDS_BATCH_SIZE]
+                   for i in range(0, len(listing_ids), LISTING_IDS_BATCH_SIZE)]
+        await asyncio.gather(*[self._resolve_batch(batch, pending) for batch in batches])
+
+    async def _resolve_batch(self, listing_ids: List[int], pending: Dict[int, asyncio.Future]) -> None:
+        try:
+            r = await self.get_listings_by_listing_ids(listing_ids)
+            r.raise_for_status()
+            listings = {listing["listing_id"]: listing for listing in (await self._json(r))["results"]}
+        except Exception as e:
+            for listing_id in listing_ids:
+                if not pending[listing_id].done():
+                    pending[listing_id].set_exception(e)
+            return
+        for listing_id in listing_ids:
+            if not pending[listing_id].done():
+                pending[listing_id].set_result(listings.get(listing_id))
+
+    async def aclose(self) -> None:
+        """
+        Cancels the lookups that are still waiting for their batch and closes the underlying aiohttp session.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        for future in self._pending.values():
+            future.cancel()
+        self._pending = {}
+        await super().aclose()
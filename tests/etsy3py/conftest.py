@@ -0,0 +1,155 @@
+import shutil
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from etsy3py.v3 import EtsyApi
+from etsy3py.v3_async import AsyncEtsyApi
+
+
+class RecordedRequest:
+    def __init__(self, method, path, headers, body):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+
+
+class LocalServer:
+    """
+    Local HTTP server answering every request through `respond(request) -> (status, headers, body)`.
+    With an ssl_context it serves HTTPS.
+    """
+    def __init__(self, ssl_context=None):
+        self.requests = []
+        self.respond = lambda request: (200, {}, b'{}')
+        self._lock = threading.Lock()
+        self._http = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._http.daemon_threads = True
+        scheme = 'http'
+        if ssl_context is not None:
+            self._http.socket = ssl_context.wrap_socket(self._http.socket, server_side=True)
+            scheme = 'https'
+        self.url = f'{scheme}://127.0.0.1:{self._http.server_port}'
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def handle_one_request(self):
+                self.raw_requestline = self.rfile.readline(65537)
+                if not self.raw_requestline or not self.parse_request():
+                    self.close_connection = True
+                    return
+                request = RecordedRequest(self.command, self.path, self.headers, self._read_body())
+                with server._lock:
+                    server.requests.append(request)
+                status, headers, body = server.respond(request)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                self.wfile.flush()
+
+            def _read_body(self):
+                if self.headers.get('Transfer-Encoding', '').lower() != 'chunked':
+                    return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                body = b''
+                while True:
+                    size = int(self.rfile.readline().split(b';')[0], 16)
+                    chunk = self.rfile.read(size + 2)[:size]
+                    if not size:
+                        # Trailers are not used, only the blank line ending the body is left
+                        return body
+                    body += chunk
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self._http.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._http.shutdown()
+        self._http.server_close()
+
+
+@pytest.fixture
+def server():
+    local_server = LocalServer()
+    local_server.start()
+    yield local_server
+    local_server.stop()
+
+
+@pytest.fixture
+def make_tls_server(tmp_path):
+    """
+    Starts HTTPS servers with a self-signed certificate for `hostname`, returning the server and the certificate path.
+    The server names clients sent with SNI are recorded in `server.sni`.
+    """
+    if shutil.which('openssl') is None:
+        pytest.skip('openssl is required to create a test certificate')
+    servers = []
+
+    def make(hostname):
+        cert, key = tmp_path / f'{hostname}.pem', tmp_path / f'{hostname}.key'
+        subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                        '-subj', f'/CN={hostname}', '-addext', f'subjectAltName=DNS:{hostname}',
+                        '-keyout', str(key), '-out', str(cert)], check=True, capture_output=True)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        sni = []
+        context.sni_callback = lambda ssl_socket, server_name, ssl_context: sni.append(server_name)
+        local_server = LocalServer(context)
+        local_server.sni = sni
+        local_server.start()
+        servers.append(local_server)
+        return local_server, str(cert)
+
+    yield make
+    for local_server in servers:
+        local_server.stop()
+
+
+@pytest.fixture
+def make_api(server):
+    """
+    Builds an EtsyApi pointed at the local server. Class attributes, e.g. max_retries, can be overridden,
+    http2=True selects the httpx backend.
+    """
+    clients = []
+
+    def make(cls=EtsyApi, http2=False, **attributes):
+        attributes.setdefault('max_retries', cls.max_retries.new(backoff_factor=0))
+        attributes.setdefault('rate_limit_per_second', 1000)
+        client_class = type(f'Local{cls.__name__}', (cls,), {'base_url': server.url, **attributes})
+        client = client_class('token', 'client-id', http2=http2)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def make_async_api(server):
+    """
+    Builds an AsyncEtsyApi pointed at the local server, to be used as an async context manager.
+    """
+    def make(cls=AsyncEtsyApi, **attributes):
+        attributes.setdefault('rate_limit_per_second', 1000)
+        client_class = type(f'Local{cls.__name__}', (cls,), {'base_url': server.url, **attributes})
+        return client_class('token', 'client-id')
+
+    return make
@@ -0,0 +1,113 @@
+import asyncio
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import aiohttp
+import pytest
+
+from etsy3py.v3_async import BatchingEtsyApi
+
+MISSING_LISTING_ID = 13
+
+
+def requested_ids(request):
+    return [int(listing_id) for listing_id in parse_qs(urlsplit(request.path).query)['listing_ids'][0].split(',')]
+
+
+def batch_server(request):
+    results = [{'listing_id': listing_id} for listing_id in requested_ids(request) if listing_id != MISSING_LISTING_ID]
+    return 200, {}, json.dumps({'count': len(results), 'results': results}).encode()
+
+
+def run(make_async_api, coroutine_function, **attributes):
+    async def main():
+        async with make_async_api(BatchingEtsyApi, **attributes) as api:
+            return await coroutine_function(api)
+
+    return asyncio.run(main())
+
+
+def test_concurrent_lookups_are_batched_by_one_hundred(server, make_async_api):
+    server.respond = batch_server
+    listing_ids = list(range(1000, 1250))
+
+    listings = run(make_async_api,
+                   lambda api: asyncio.gather(*[api.load_listing(listing_id) for listing_id in listing_ids]))
+
+    assert listings == [{'listing_id': listing_id} for listing_id in listing_ids]
+    assert len(server.requests) == 3
+    assert all(request.path.startswith('/v3/application/listings/batch?') for request in server.requests)
+    assert sorted(len(requested_ids(request)) for request in server.requests) == [50, 100, 100]
+    assert sorted(sum((requested_ids(request) for request in server.requests), [])) == listing_ids
+
+
+def test_duplicate_ids_share_one_lookup(server, make_async_api):
+    server.respond = batch_server
+
+    listings = run(make_async_api,
+                   lambda api: asyncio.gather(*[api.load_listing(listing_id) for listing_id in [1, 2, 1, 1]]))
+
+    assert listings == [{'listing_id': 1}, {'listing_id': 2}, {'listing_id': 1}, {'listing_id': 1}]
+    assert listings[0] is listings[2]
+    assert len(server.requests) == 1
+    assert requested_ids(server.requests[0]) == [1, 2]
+
+
+def test_missing_listing_returns_none(server, make_async_api):
+    server.respond = batch_server
+
+    listings = run(make_async_api,
+                   lambda api: asyncio.gather(api.load_listing(1), api.load_listing(MISSING_LISTING_ID)))
+
+    assert listings == [{'listing_id': 1}, None]
+
+
+def test_lookups_in_separate_windows_are_separate_batches(server, make_async_api):
+    server.respond = batch_server
+
+    async def load(api):
+        first = await api.load_listing(1)
+        second = await api.load_listing(2)
+        return first, second
+
+    assert run(make_async_api, load) == ({'listing_id': 1}, {'listing_id': 2})
+    assert len(server.requests) == 2
+
+
+def test_failed_batch_raises_for_every_caller(server, make_async_api):
+    server.respond = lambda request: (404, {}, b'{"error": "not found"}')
+
+    async def load(api):
+        return await asyncio.gather(api.load_listing(1), api.load_listing(2), return_exceptions=True)
+
+    errors = run(make_async_api, load)
+
+    assert all(isinstance(error, aiohttp.ClientResponseError) and error.status == 404 for error in errors)
+    assert len(server.requests) == 1
+
+
+def test_cancelled_caller_does_not_cancel_the_lookup_of_others(server, make_async_api):
+    server.respond = batch_server
+
+    async def load(api):
+        first = asyncio.ensure_future(api.load_listing(1))
+        second = asyncio.ensure_future(api.load_listing(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert run(make_async_api, load) == {'listing_id': 1}
+    assert len(server.requests) == 1
+
+
+def test_aclose_cancels_waiting_lookups(server, make_async_api):
+    async def main():
+        api = make_async_api(BatchingEtsyApi, batch_window=10)
+        lookup = asyncio.ensure_future(api.load_listing(1))
+        await asyncio.sleep(0)
+        await api.aclose()
+        with pytest.raises(asyncio.CancelledError):
+            await lookup
+
+    asyncio.run(main())
+    assert server.requests == []
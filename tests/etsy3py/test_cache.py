@@ -0,0 +1,111 @@
+import pytest
+
+from etsy3py import cache as cache_module
+from etsy3py.base_client import BaseApiClient
+from etsy3py.cache import cached
+from etsy3py.v3 import EtsyApi
+
+
+class FakeResponse:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+
+class Client:
+    def __init__(self):
+        self.calls = []
+
+    @cached(ttl=60)
+    def fetch(self, item_id, **kwargs):
+        self.calls.append((item_id, kwargs))
+        return FakeResponse()
+
+
+def test_repeated_calls_are_served_from_the_cache():
+    client = Client()
+    first = client.fetch(1, state='active')
+    assert client.fetch(1, state='active') is first
+    assert client.fetch(1, state='active', limit=None) is first
+    assert len(client.calls) == 1
+
+
+def test_list_kwargs_are_cached():
+    client = Client()
+    first = client.fetch(1, includes=['Listing'])
+    assert client.fetch(1, includes=['Listing']) is first
+    assert client.fetch(1, includes=['Listing', 'Images']) is not first
+    assert len(client.calls) == 2
+
+
+def test_unhashable_kwargs_bypass_the_cache():
+    client = Client()
+    client.fetch(1, filters={'state': 'active'})
+    client.fetch(1, filters={'state': 'active'})
+    assert len(client.calls) == 2
+    Client.fetch.cache_clear_for(client, 1, filters={'state': 'active'})
+
+
+def test_cache_clear_for_drops_one_entry():
+    client = Client()
+    client.fetch(1, includes=['Listing'])
+    client.fetch(2)
+    Client.fetch.cache_clear_for(client, 1, includes=['Listing'])
+    client.fetch(1, includes=['Listing'])
+    client.fetch(2)
+    assert [call[0] for call in client.calls] == [1, 2, 1]
+
+
+def test_entry_expiring_during_lookup_is_fetched_again(monkeypatch):
+    class ExpiringCache(cache_module.TTLCache):
+        # Reports every entry as present but expires it on read, like a ttl running out between the two
+        def __contains__(self, key):
+            return True
+
+        def __getitem__(self, key):
+            return self.__missing__(key)
+
+    monkeypatch.setattr(cache_module, 'TTLCache', ExpiringCache)
+
+    class ExpiringClient(Client):
+        @cached(ttl=60)
+        def fetch(self, item_id, **kwargs):
+            self.calls.append((item_id, kwargs))
+            return FakeResponse()
+
+    client = ExpiringClient()
+    client.fetch(1)
+    client.fetch(1)
+    assert len(client.calls) == 2
+
+
+def test_stale_response_is_served_on_server_error():
+    class FlakyClient:
+        def __init__(self):
+            self.statuses = [200, 503]
+
+        @cached(ttl=0, stale_if_error=True)
+        def fetch(self, item_id):
+            return FakeResponse(self.statuses.pop(0))
+
+    client = FlakyClient()
+    first = client.fetch(1)
+    assert client.fetch(1) is first
+
+
+@pytest.mark.parametrize('method, args, kwargs', [
+    ('get_listing_inventory', (1,), {'includes': ['Listing']}),
+    ('get_shop_receipts', (1,), {'foo': [1, 2]}),
+])
+def test_endpoints_accept_list_kwargs(monkeypatch, method, args, kwargs):
+    calls = []
+
+    def fake_get(self, path, params=None, headers=None, auth_type='none'):
+        calls.append((path, params))
+        return FakeResponse()
+
+    monkeypatch.setattr(BaseApiClient, '_get', fake_get)
+    api = EtsyApi('token', 'client-id', strict=False)
+    first = getattr(api, method)(*args, **kwargs)
+    assert getattr(api, method)(*args, **kwargs) is first
+    assert len(calls) == 1
@@ -0,0 +1,36 @@
+import gzip
+import importlib.util
+
+import httpx
+import pytest
+
+BROTLI_INSTALLED = any(importlib.util.find_spec(name) for name in ('brotli', 'brotlicffi'))
+
+
+def accepted_encodings(request):
+    return {encoding.strip() for encoding in request.headers['Accept-Encoding'].split(',')}
+
+
+def test_br_is_only_requested_with_a_brotli_decoder(server, make_api):
+    api = make_api()
+    api.get_listing(1)
+
+    encodings = accepted_encodings(server.requests[0])
+    assert {'gzip', 'deflate'} <= encodings
+    assert ('br' in encodings) is BROTLI_INSTALLED
+
+
+def test_http2_backend_requests_what_httpx_decodes(server, make_api):
+    api = make_api(http2=True)
+    api.get_listing(1)
+
+    assert accepted_encodings(server.requests[0]) == {
+        encoding.strip() for encoding in httpx.Client().headers['Accept-Encoding'].split(',')}
+
+
+@pytest.mark.parametrize('http2', [False, True])
+def test_gzip_responses_are_decoded(server, make_api, http2):
+    server.respond = lambda request: (200, {'Content-Encoding': 'gzip'}, gzip.compress(b'{"listing_id": 1}'))
+    api = make_api(http2=http2)
+
+    assert api.get_listing(1).json() == {'listing_id': 1}
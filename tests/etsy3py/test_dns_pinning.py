@@ -0,0 +1,111 @@
+import socket
+
+import pytest
+import requests
+
+from etsy3py.v3 import EtsyApi
+
+HOSTNAME = 'api.etsy3py.test'
+
+
+class Lookups(list):
+    """
+    The recorded lookups of HOSTNAME, which resolves to the queued addresses first and to 127.0.0.1 afterwards.
+    """
+    def __init__(self):
+        super().__init__()
+        self.addresses = []
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    resolved = Lookups()
+    getaddrinfo = socket.getaddrinfo
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        if host == HOSTNAME:
+            resolved.append(host)
+            host = resolved.addresses.pop(0) if resolved.addresses else '127.0.0.1'
+        return getaddrinfo(host, port, *args, **kwargs)
+
+    monkeypatch.setattr(socket, 'getaddrinfo', fake_getaddrinfo)
+    return resolved
+
+
+@pytest.fixture
+def make_pinned_api(monkeypatch):
+    clients = []
+    # Either would take precedence over session.verify
+    monkeypatch.delenv('REQUESTS_CA_BUNDLE', raising=False)
+    monkeypatch.delenv('CURL_CA_BUNDLE', raising=False)
+
+    def make(server, cert, dns_pin_ttl=60):
+        port = server.url.rsplit(':', 1)[1]
+        client_class = type('LocalPinnedEtsyApi', (EtsyApi,), {
+            'base_url': f'https://{HOSTNAME}:{port}',
+            'dns_pin_ttl': dns_pin_ttl,
+            'max_retries': EtsyApi.max_retries.new(backoff_factor=0),
+        })
+        client = client_class('token', 'client-id')
+        client.session.verify = cert
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def test_address_is_resolved_once(make_tls_server, make_pinned_api, lookups):
+    server, cert = make_tls_server(HOSTNAME)
+    api = make_pinned_api(server, cert)
+
+    api.get_listing(1)
+    api.get_listing(2)
+    # A new connection reuses the pinned address as well
+    api.close()
+    api.get_listing(3)
+
+    assert lookups == [HOSTNAME]
+    assert [request.path for request in server.requests] == [f'/v3/application/listings/{i}' for i in (1, 2, 3)]
+    assert server.requests[0].headers['Host'] == api.base_url[len('https://'):]
+
+
+def test_sni_and_certificate_check_use_the_hostname(make_tls_server, make_pinned_api, lookups):
+    # The certificate only names HOSTNAME, a check against the pinned IP address would fail
+    server, cert = make_tls_server(HOSTNAME)
+    api = make_pinned_api(server, cert)
+
+    assert api.get_listing(1).status_code == 200
+    assert server.sni == [HOSTNAME]
+
+
+def test_certificate_for_another_host_is_rejected(make_tls_server, make_pinned_api, lookups):
+    server, cert = make_tls_server('other.etsy3py.test')
+    api = make_pinned_api(server, cert)
+
+    with pytest.raises(requests.exceptions.SSLError):
+        api.get_listing(1)
+    assert server.requests == []
+
+
+def test_expired_address_is_resolved_again(make_tls_server, make_pinned_api, lookups):
+    server, cert = make_tls_server(HOSTNAME)
+    api = make_pinned_api(server, cert, dns_pin_ttl=0)
+
+    api.get_listing(1)
+    api.close()
+    api.get_listing(2)
+
+    assert lookups == [HOSTNAME, HOSTNAME]
+
+
+def test_failed_connection_resolves_again(make_tls_server, make_pinned_api, lookups):
+    server, cert = make_tls_server(HOSTNAME)
+    api = make_pinned_api(server, cert)
+    # Nothing listens there, the connection is refused and retried by urllib3
+    lookups.addresses.append('127.0.0.2')
+
+    assert api.get_listing(1).status_code == 200
+    assert lookups == [HOSTNAME, HOSTNAME]
+    assert len(server.requests) == 1
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+from etsy3py.endpoints import SHOP_RECEIPTS_SPEC, SHOP_RECEIPT_PATH, validate_kwargs
+
+
+def test_path_templates_are_formatted_positionally():
+    assert SHOP_RECEIPT_PATH(1, 2) == '/v3/application/shops/1/receipts/2'
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'limit': 0}, ValueError),
+    ({'limit': '0'}, ValueError),
+    ({'limit': 'ten'}, TypeError),
+    ({'limit': True}, TypeError),
+    ({'sort_on': 'price'}, ValueError),
+    ({'was_paid': 'yes'}, TypeError),
+    ({'was_paid': 'True'}, TypeError),
+])
+def test_invalid_kwargs_are_rejected(kwargs, error):
+    with pytest.raises(error):
+        validate_kwargs(SHOP_RECEIPTS_SPEC, kwargs)
+
+
+def test_valid_none_and_unknown_kwargs_pass():
+    validate_kwargs(SHOP_RECEIPTS_SPEC, {'limit': 100, 'sort_on': 'created', 'was_paid': None, 'foo': [1, 2]})
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'limit': '50'},
+    {'offset': '25', 'min_created': '1700000000'},
+    {'was_paid': 'true', 'was_shipped': 'false'},
+])
+def test_string_forms_accepted_by_etsy_pass(kwargs):
+    validate_kwargs(SHOP_RECEIPTS_SPEC, kwargs)
+
+
+def test_string_forms_are_sent_as_given(server, make_api):
+    api = make_api()
+    api.get_shop_receipts(1, limit='50', was_paid='true')
+    assert server.requests[0].path.endswith('?limit=50&was_paid=true')
+
+
+def test_async_client_does_not_import_requests():
+    code = "import sys, etsy3py.v3_async; print('requests' in sys.modules or 'etsy3py.v3' in sys.modules)"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == 'False'
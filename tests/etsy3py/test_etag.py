@@ -0,0 +1,73 @@
+import asyncio
+
+
+def etag_server(request):
+    if request.headers.get('If-None-Match') == '"v1"':
+        return 304, {'ETag': '"v1"'}, b''
+    return 200, {'ETag': '"v1"', 'Content-Type': 'application/json'}, b'{"listing_id": 1}'
+
+
+def test_not_modified_returns_the_stored_response(server, make_api):
+    server.respond = etag_server
+    api = make_api()
+
+    first = api.get_listing(1)
+    second = api.get_listing(1)
+
+    assert 'If-None-Match' not in server.requests[0].headers
+    assert server.requests[1].headers['If-None-Match'] == '"v1"'
+    assert second is first
+    assert second.json() == {'listing_id': 1}
+
+
+def test_last_modified_is_revalidated(server, make_api):
+    last_modified = 'Wed, 14 Oct 2026 09:00:00 GMT'
+
+    def respond(request):
+        if request.headers.get('If-Modified-Since') == last_modified:
+            return 304, {}, b''
+        return 200, {'Last-Modified': last_modified}, b'{"listing_id": 1}'
+
+    server.respond = respond
+    api = make_api()
+
+    first = api.get_listing(1)
+    assert api.get_listing(1) is first
+    assert server.requests[1].headers['If-Modified-Since'] == last_modified
+
+
+def test_validators_are_kept_per_query(server, make_api):
+    server.respond = etag_server
+    api = make_api()
+
+    api.get_listing(1)
+    api.get_listing(1, includes=['Images'])
+
+    assert 'If-None-Match' not in server.requests[1].headers
+
+
+def test_async_not_modified_returns_the_stored_response(server, make_async_api):
+    server.respond = etag_server
+
+    async def fetch():
+        async with make_async_api() as api:
+            first = await api.get_listing(1)
+            second = await api.get_listing(1)
+            return first, second, await api._json(second)
+
+    first, second, body = asyncio.run(fetch())
+    assert server.requests[1].headers['If-None-Match'] == '"v1"'
+    assert second is first
+    assert body == {'listing_id': 1}
+
+
+def test_unhashable_params_bypass_the_etag_store(server, make_api):
+    server.respond = etag_server
+    api = make_api()
+
+    api.get_listing(1, includes={'Images'})
+    response = api.get_listing(1, includes={'Images'})
+
+    assert response.status_code == 200
+    assert [request.path for request in server.requests] == ['/v3/application/listings/1?includes=Images'] * 2
+    assert 'If-None-Match' not in server.requests[1].headers
@@ -0,0 +1,82 @@
+import gzip
+import json
+from urllib.parse import urlsplit
+
+import pytest
+
+BACKENDS = pytest.mark.parametrize('http2', [False, True], ids=['requests', 'httpx'])
+
+
+@BACKENDS
+def test_query_parameters_match_the_requests_backend(server, make_api, http2):
+    api = make_api(http2=http2)
+
+    api.get_shop_receipts(1, was_paid=True, was_shipped=False, limit=5, min_created=None)
+    api.get_listings_by_listing_ids([1, 2, 3])
+
+    assert [urlsplit(request.path).query for request in server.requests] == [
+        'was_paid=true&was_shipped=false&limit=5',
+        'listing_ids=1%2C2%2C3',
+    ]
+
+
+@BACKENDS
+def test_not_modified_returns_the_stored_response(server, make_api, http2):
+    def respond(request):
+        if request.headers.get('If-None-Match') == '"v1"':
+            return 304, {}, b''
+        return 200, {'ETag': '"v1"'}, b'{"listing_id": 1}'
+
+    server.respond = respond
+    api = make_api(http2=http2)
+
+    first = api.get_listing(1)
+    assert api.get_listing(1) is first
+    assert first.json() == {'listing_id': 1}
+    assert server.requests[1].headers['If-None-Match'] == '"v1"'
+
+
+def test_server_error_is_passed_through_without_retries(server, make_api):
+    server.respond = lambda request: (503, {}, b'{"error": "unavailable"}')
+    api = make_api(http2=True)
+
+    response = api.get_listing(1)
+
+    assert response.status_code == 503
+    assert response.json() == {'error': 'unavailable'}
+    assert not response.ok
+    assert len(server.requests) == 1
+
+
+@BACKENDS
+def test_streamed_response_exposes_the_raw_body(server, make_api, http2):
+    server.respond = lambda request: (200, {}, b'{"products": []}')
+    api = make_api(http2=http2)
+
+    response = api.get_listing_inventory_stream(1)
+
+    assert response.raw.read() == b'{"products": []}'
+
+
+@BACKENDS
+def test_large_bodies_are_gzipped(server, make_api, http2):
+    api = make_api(http2=http2, gzip_request_threshold=0)
+    products = [{'sku': 'sku-1', 'offerings': [{'price': 1.5, 'quantity': 2, 'is_enabled': True}]}]
+
+    api.update_listing_inventory(1, products)
+
+    request = server.requests[0]
+    assert request.headers['Content-Encoding'] == 'gzip'
+    assert request.headers['Content-Type'] == 'application/json'
+    assert json.loads(gzip.decompress(request.body))['products'] == products
+
+
+@BACKENDS
+def test_client_is_usable_after_close(server, make_api, http2):
+    api = make_api(http2=http2)
+
+    api.get_listing(1)
+    api.close()
+
+    assert api.get_listing(2).status_code == 200
+    assert len(server.requests) == 2
@@ -0,0 +1,49 @@
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from etsy3py.params import prepare_params
+
+
+def query(request):
+    return parse_qs(urlsplit(request.path).query)
+
+
+@pytest.mark.parametrize('params, expected', [
+    (None, None),
+    ({}, None),
+    ({'limit': 1, 'offset': 0}, {'limit': 1, 'offset': 0}),
+    ({'was_paid': True, 'was_shipped': False}, {'was_paid': 'true', 'was_shipped': 'false'}),
+    ({'state': None, 'limit': 25}, {'limit': 25}),
+    ({'listing_ids': [1, 2, 3]}, {'listing_ids': '1,2,3'}),
+    ({'includes': ('Images', 'Shop')}, {'includes': 'Images,Shop'}),
+])
+def test_prepare_params(params, expected):
+    assert prepare_params(params) == expected
+
+
+def test_listing_ids_are_sent_comma_separated(server, make_api):
+    api = make_api()
+
+    api.get_listings_by_listing_ids([1, 2, 3], includes=['Images', 'Shop'])
+
+    assert query(server.requests[0]) == {'listing_ids': ['1,2,3'], 'includes': ['Images,Shop']}
+
+
+def test_bulk_batches_are_sent_comma_separated(server, make_api):
+    api = make_api()
+
+    api.get_listings_bulk(list(range(150)))
+
+    sent = sorted(query(request)['listing_ids'][0] for request in server.requests)
+    assert sent == sorted([','.join(map(str, range(100))), ','.join(map(str, range(100, 150)))])
+
+
+def test_async_listing_ids_are_sent_comma_separated(server, make_async_api):
+    async def fetch():
+        async with make_async_api() as api:
+            await api.get_listings_by_listing_ids([1, 2, 3], includes=['Images'])
+
+    asyncio.run(fetch())
+    assert query(server.requests[0]) == {'listing_ids': ['1,2,3'], 'includes': ['Images']}
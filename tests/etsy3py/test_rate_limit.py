@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import pytest
+
+from etsy3py.rate_limit import backoff_delay, daily_quota_exhausted
+
+QUOTA_EXHAUSTED = {'Retry-After': '2', 'X-Remaining-Today': '0'}
+
+
+def test_exhausted_daily_quota_is_not_retried(server, make_api):
+    server.respond = lambda request: (429, QUOTA_EXHAUSTED, b'{}')
+    api = make_api()
+
+    started = time.monotonic()
+    response = api.get_listing(1)
+
+    assert response.status_code == 429
+    assert len(server.requests) == 1
+    assert time.monotonic() - started < 1
+
+
+def test_exhausted_daily_quota_is_not_retried_on_writes(server, make_api):
+    server.respond = lambda request: (429, QUOTA_EXHAUSTED, b'{}')
+    api = make_api()
+
+    assert api.update_shop_receipt(1, 2, was_shipped=True).status_code == 429
+    assert len(server.requests) == 1
+
+
+def test_async_exhausted_daily_quota_is_not_retried(server, make_async_api):
+    server.respond = lambda request: (429, QUOTA_EXHAUSTED, b'{}')
+
+    async def fetch():
+        async with make_async_api() as api:
+            return (await api.get_listing(1)).status
+
+    assert asyncio.run(fetch()) == 429
+    assert len(server.requests) == 1
+
+
+def test_async_throttled_request_is_retried(server, make_async_api):
+    statuses = [429, 429]
+    server.respond = lambda request: (statuses.pop(0) if statuses else 200, {'Retry-After': '0'}, b'{}')
+
+    async def fetch():
+        async with make_async_api() as api:
+            return (await api.get_listing(1)).status
+
+    assert asyncio.run(fetch()) == 200
+    assert len(server.requests) == 3
+
+
+@pytest.mark.parametrize('headers, attempt, expected', [
+    ({'Retry-After': '3'}, 0, 3),
+    ({'Retry-After': '3600'}, 0, 60),
+    ({}, 2, 4),
+    ({'Retry-After': 'soon'}, 1, 2),
+])
+def test_backoff_delay(headers, attempt, expected):
+    assert backoff_delay(headers, attempt, max_backoff=60) == expected
+
+
+@pytest.mark.parametrize('headers, expected', [
+    ({'X-Remaining-Today': '0'}, True),
+    ({'X-Remaining-Today': '15'}, False),
+    ({'X-Remaining-Today': ''}, False),
+    ({}, False),
+])
+def test_daily_quota_exhausted(headers, expected):
+    assert daily_quota_exhausted(headers) is expected
@@ -0,0 +1,78 @@
+from etsy3py.base_client import BaseApiClient
+
+
+def test_persistent_server_error_returns_the_last_response(server, make_api):
+    server.respond = lambda request: (503, {}, b'{"error": "unavailable"}')
+    api = make_api()
+
+    response = api.get_listing(1)
+
+    assert response.status_code == 503
+    assert response.json() == {'error': 'unavailable'}
+    assert len(server.requests) == BaseApiClient.max_retries.total + 1
+
+
+def test_server_error_is_retried_until_it_succeeds(server, make_api):
+    statuses = [502, 500]
+    server.respond = lambda request: (statuses.pop(0) if statuses else 200, {}, b'{"listing_id": 1}')
+    api = make_api()
+
+    response = api.get_listing(1)
+
+    assert response.status_code == 200
+    assert len(server.requests) == 3
+
+
+def test_post_is_never_replayed(server, make_api):
+    server.respond = lambda request: (503, {}, b'{}')
+    api = make_api()
+
+    response = api.create_draft_listing(1, title='title')
+
+    assert response.status_code == 503
+    assert len(server.requests) == 1
+
+
+def test_throttled_request_is_only_retried_by_the_client(server, make_api, monkeypatch):
+    server.respond = lambda request: (429, {'Retry-After': '0'}, b'{}')
+    api = make_api()
+    acquired = []
+    monkeypatch.setattr(api._limiter, 'acquire', lambda: acquired.append(1))
+
+    response = api.get_listing(1)
+
+    assert response.status_code == 429
+    # One attempt per _make_request iteration, none hidden in the adapter, each of them paced by the limiter
+    assert len(server.requests) == api.rate_limit_retries + 1
+    assert len(acquired) == len(server.requests)
+
+
+def test_retry_after_of_a_throttled_request_is_capped(server, make_api, monkeypatch):
+    server.respond = lambda request: (429, {'Retry-After': '3600'}, b'{}')
+    api = make_api(rate_limit_retries=2, rate_limit_max_backoff=0.01)
+    sleeps = []
+    monkeypatch.setattr('etsy3py.base_client.time.sleep', sleeps.append)
+
+    api.get_listing(1)
+
+    assert sleeps == [0.01, 0.01]
+    assert len(server.requests) == 3
+
+
+def test_payload_too_large_is_not_replayed(server, make_api):
+    server.respond = lambda request: (413, {'Retry-After': '0'}, b'{}')
+    api = make_api()
+
+    response = api.update_listing(1, 2, title='title')
+
+    assert response.status_code == 413
+    assert len(server.requests) == 1
+
+
+def test_unavailable_with_retry_after_is_retried_by_the_adapter(server, make_api):
+    statuses = [503]
+    server.respond = lambda request: (statuses.pop(0) if statuses else 200, {'Retry-After': '0'}, b'{}')
+    api = make_api()
+
+    assert api.get_listing(1).status_code == 200
+    assert len(server.requests) == 2
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from etsy3py.serialization import StreamedJSONBody, dumps
+
+
+class SmallChunksBody(StreamedJSONBody):
+    chunk_size = 64
+
+
+def inventory(count):
+    return {
+        'products': [{'sku': f'sku-{i}', 'property_values': [],
+                      'offerings': [{'price': 1.5 + i, 'quantity': i, 'is_enabled': True}]}
+                     for i in range(count)],
+        'price_on_property': [513],
+        'quantity_on_property': [],
+        'sku_on_property': [],
+    }
+
+
+@pytest.mark.parametrize('count', [0, 1, 3, 200])
+def test_streamed_body_matches_the_serialized_body(count):
+    body = inventory(count)
+
+    chunks = list(SmallChunksBody(body, 'products'))
+
+    assert json.loads(b''.join(chunks)) == json.loads(dumps(body)) == body
+    # Every product exceeds the 64 byte chunk size, so any product flushes a chunk of its own
+    assert (len(chunks) > 1) is (count > 0)
+
+
+def test_empty_list_is_a_valid_body():
+    assert b''.join(StreamedJSONBody({'products': []}, 'products')) == b'{"products":[]}'
+
+
+def test_streamed_body_can_be_iterated_again():
+    body = StreamedJSONBody(inventory(50), 'products')
+    assert list(body) == list(body)
+
+
+@pytest.mark.parametrize('status', [429, 503])
+def test_retried_upload_sends_identical_bytes(server, make_api, status):
+    statuses = [status]
+    server.respond = lambda request: (statuses.pop(0) if statuses else 200, {'Retry-After': '0'}, b'{}')
+    api = make_api()
+    body = inventory(2000)
+
+    response = api.update_listing_inventory(1, body.pop('products'), stream_body=True, **body)
+
+    assert response.status_code == 200
+    first, second = server.requests
+    assert first.headers['Transfer-Encoding'] == 'chunked'
+    assert first.headers['Content-Type'] == 'application/json'
+    assert first.body == second.body
+    assert json.loads(second.body) == inventory(2000)
+
+
+def test_streamed_upload_matches_the_buffered_upload(server, make_api):
+    api = make_api()
+    body = inventory(20)
+
+    api.update_listing_inventory(1, body['products'], price_on_property=body['price_on_property'])
+    api.update_listing_inventory(1, body['products'], stream_body=True, price_on_property=body['price_on_property'])
+
+    buffered, streamed = server.requests
+    assert 'Transfer-Encoding' not in buffered.headers
+    assert json.loads(streamed.body) == json.loads(buffered.body)
@@ -0,0 +1,34 @@
+from requests import Session
+
+
+def test_session_settings_apply_to_worker_threads(server, make_api):
+    server.respond = lambda request: (200, {}, b'{"count": 2, "results": [1, 2]}')
+    api = make_api()
+    api.session.headers['X-Tenant'] = 'shop-1'
+
+    api.get_receipts_bulk(1, [1, 2, 3], workers=3)
+    list(api.iter_shop_receipts(1))
+    api.get_listings_bulk(list(range(150)), max_workers=2)
+
+    assert len(server.requests) == 6
+    assert all(request.headers['X-Tenant'] == 'shop-1' for request in server.requests)
+
+
+def test_session_can_be_replaced(server, make_api):
+    api = make_api()
+    session = Session()
+    session.headers.update({'x-api-key': 'other-client-id', 'X-Custom': '1'})
+    api.session = session
+
+    api.get_listing(1)
+
+    assert server.requests[0].headers['x-api-key'] == 'other-client-id'
+    assert server.requests[0].headers['X-Custom'] == '1'
+
+
+def test_client_is_usable_after_close(server, make_api):
+    api = make_api()
+    with api:
+        api.get_listing(1)
+    api.get_listing(2)
+    assert len(server.requests) == 2
@@ -0,0 +1,76 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def slow_listing(request):
+    time.sleep(0.3)
+    return 200, {}, b'{"listing_id": 42}'
+
+
+def test_concurrent_identical_gets_share_one_request(server, make_api):
+    server.respond = slow_listing
+    api = make_api()
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        responses = list(executor.map(lambda _: api.get_listing(42), range(5)))
+
+    assert len(server.requests) == 1
+    assert all(response is responses[0] for response in responses)
+    assert responses[0].json() == {'listing_id': 42}
+
+
+def test_different_gets_are_not_shared(server, make_api):
+    server.respond = slow_listing
+    api = make_api()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(api.get_listing, [1, 2]))
+
+    assert len(server.requests) == 2
+
+
+def test_sequential_gets_are_sent_again(server, make_api):
+    api = make_api()
+    api.get_listing(42)
+    api.get_listing(42)
+    assert len(server.requests) == 2
+
+
+def test_async_concurrent_identical_gets_share_one_request(server, make_async_api):
+    server.respond = slow_listing
+
+    async def fetch():
+        async with make_async_api() as api:
+            responses = await asyncio.gather(*[api.get_listing(42) for _ in range(5)])
+            return [await api._json(response) for response in responses]
+
+    assert asyncio.run(fetch()) == [{'listing_id': 42}] * 5
+    assert len(server.requests) == 1
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_request(server, make_async_api):
+    server.respond = slow_listing
+
+    async def fetch():
+        async with make_async_api() as api:
+            first = asyncio.ensure_future(api.get_listing(42))
+            second = asyncio.ensure_future(api.get_listing(42))
+            await asyncio.sleep(0.05)
+            first.cancel()
+            response = await second
+            return response.status
+
+    assert asyncio.run(fetch()) == 200
+    assert len(server.requests) == 1
+
+
+def test_unhashable_params_are_sent_without_sharing(server, make_api):
+    server.respond = slow_listing
+    api = make_api()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        responses = list(executor.map(lambda _: api.get_listing(42, includes={'Images'}), range(2)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len(server.requests) == 2